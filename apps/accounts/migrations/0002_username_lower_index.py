@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+USERNAME_LOWER_INDEX = models.Index(
+    Lower("username"), name="accounts_username_lower_idx")
+
+
+def _user_model(apps):
+    return apps.get_model(settings.AUTH_USER_MODEL)
+
+
+def add_index(apps, schema_editor):
+    schema_editor.add_index(_user_model(apps), USERNAME_LOWER_INDEX)
+
+
+def remove_index(apps, schema_editor):
+    schema_editor.remove_index(_user_model(apps), USERNAME_LOWER_INDEX)
+
+
+class Migration(migrations.Migration):
+    """
+    Expression index on LOWER(username) for the availability check. The
+    user model belongs to django.contrib.auth, so it is added through the
+    schema editor rather than AddIndex.
+    """
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        # SQLite rebuilds auth_user for auth's own AlterFields, dropping
+        # indexes the model state does not know about; run after them.
+        ("auth", "0012_alter_user_first_name_max_length"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
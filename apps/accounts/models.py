@@ -1,8 +1,16 @@
 from django.db import models
-from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.contrib.auth.models import Group, User
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
 from django.dispatch import receiver
 
+from .roles import invalidate_roles
+from .usernames import forget_username
+
 
 class UserProfile(models.Model):
 
@@ -52,3 +60,36 @@ def save_user_profile(sender, instance, **kwargs):
 
     if hasattr(instance, 'userprofile'):
         instance.userprofile.save()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_username(sender, instance, **kwargs):
+    forget_username(instance.username)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_profile_role(sender, instance, **kwargs):
+    invalidate_roles([instance.user_id])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_group_membership_roles(sender, instance, action, reverse,
+                                      pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        invalidate_roles([instance.pk])
+    elif action == "pre_clear":
+        invalidate_roles(instance.user_set.values_list("pk", flat=True))
+    else:
+        invalidate_roles(pk_set or ())
+
+
+@receiver(post_save, sender=Group)
+@receiver(pre_delete, sender=Group)
+def invalidate_group_roles(sender, instance, **kwargs):
+    if instance.pk and not kwargs.get("created"):
+        invalidate_roles(instance.user_set.values_list("pk", flat=True))
@@ -0,0 +1,84 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from apps.core.cache import accounts_cache
+
+MANAGER_GROUP_NAMES = ("Manager", "Managers")
+
+ROLE_CACHE_ATTR = "_cached_is_manager"
+
+
+def role_cache_key(user_id):
+    return f"is_manager:{user_id}"
+
+
+def _resolve_is_manager(user):
+    if user.is_staff or user.is_superuser:
+        return True
+
+    key = role_cache_key(user.pk)
+    cached = accounts_cache.get(key)
+    if cached is not None:
+        return cached
+
+    User = get_user_model()
+    result = (
+        User.objects.filter(pk=user.pk)
+        .filter(
+            Q(userprofile__role="manager")
+            | Q(groups__name__in=MANAGER_GROUP_NAMES)
+        )
+        .exists()
+    )
+    accounts_cache.set(key, result, settings.ROLE_CACHE_TIMEOUT)
+    return result
+
+
+def is_manager(user):
+    """
+    Return True if ``user`` has the manager role.
+
+    Staff and superusers are managers, as is anyone whose profile role is
+    ``manager`` or who belongs to a Manager/Managers group. The answer is
+    memoized on the user object for the rest of the request and shared
+    across requests through the cache until a profile or group change
+    invalidates it.
+    """
+    if user is None or not user.is_authenticated:
+        return False
+
+    cached = getattr(user, ROLE_CACHE_ATTR, None)
+    if cached is None:
+        cached = _resolve_is_manager(user)
+        setattr(user, ROLE_CACHE_ATTR, cached)
+    return cached
+
+
+async def ais_manager(user):
+    """``is_manager`` for async views; a cold lookup runs in a worker thread."""
+    cached = getattr(user, ROLE_CACHE_ATTR, None)
+    if cached is None:
+        cached = await sync_to_async(is_manager)(user)
+    return cached
+
+
+def get_role(user):
+    if user is None or not user.is_authenticated:
+        return None
+    return "manager" if is_manager(user) else "employee"
+
+
+def clear_role_cache(user):
+    try:
+        delattr(user, ROLE_CACHE_ATTR)
+    except AttributeError:
+        pass
+    invalidate_roles([user.pk])
+
+
+def invalidate_roles(user_ids):
+    keys = [role_cache_key(pk) for pk in user_ids]
+    if keys:
+        accounts_cache.delete_many(keys)
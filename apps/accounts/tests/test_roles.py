@@ -0,0 +1,103 @@
+from django.contrib.auth.models import AnonymousUser, Group, User
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.roles import clear_role_cache, get_role, is_manager
+
+
+class RoleResolutionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="someone", password="pass12345")
+
+    def _fresh(self):
+        return User.objects.get(pk=self.user.pk)
+
+    def test_employee_by_default(self):
+        self.assertFalse(is_manager(self._fresh()))
+        self.assertEqual(get_role(self._fresh()), "employee")
+        self.assertIsNone(get_role(AnonymousUser()))
+
+    def test_profile_role_group_and_staff_all_count(self):
+        self.user.userprofile.role = "manager"
+        self.user.userprofile.save()
+        self.assertTrue(is_manager(self._fresh()))
+
+        self.user.userprofile.role = "employee"
+        self.user.userprofile.save()
+        self.user.groups.add(Group.objects.create(name="Managers"))
+        self.assertTrue(is_manager(self._fresh()))
+
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        with self.assertNumQueries(0):
+            self.assertTrue(is_manager(staff))
+
+    def test_memoized_on_user_object(self):
+        user = self._fresh()
+        with self.assertNumQueries(1):
+            is_manager(user)
+            is_manager(user)
+            get_role(user)
+
+        clear_role_cache(user)
+        with self.assertNumQueries(1):
+            is_manager(user)
+
+    def test_task_list_resolves_role_once(self):
+        self.client.login(username="someone", password="pass12345")
+        with self.assertNumQueries(4):
+            r = self.client.get(reverse("tasks:task_list"))
+        self.assertEqual(r.status_code, 200)
+
+
+    def test_home_page_links_group_managers_to_their_dashboard(self):
+        self.user.groups.add(Group.objects.create(name="Managers"))
+        self.client.login(username="someone", password="pass12345")
+
+        r = self.client.get(reverse("core:home"))
+
+        self.assertContains(r, "Go to manager dashboard")
+
+class RoleCacheInvalidationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="someone", password="pass12345")
+
+    def _check(self):
+        return is_manager(User.objects.get(pk=self.user.pk))
+
+    def test_answer_shared_across_requests(self):
+        self.assertFalse(self._check())
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertFalse(is_manager(user))
+
+    def test_profile_save_invalidates(self):
+        self.assertFalse(self._check())
+        self.user.userprofile.role = "manager"
+        self.user.userprofile.save()
+        self.assertTrue(self._check())
+
+    def test_group_membership_changes_invalidate(self):
+        managers = Group.objects.create(name="Managers")
+        self.assertFalse(self._check())
+
+        self.user.groups.add(managers)
+        self.assertTrue(self._check())
+
+        managers.user_set.remove(self.user)
+        self.assertFalse(self._check())
+
+        managers.user_set.add(self.user)
+        self.assertTrue(self._check())
+        managers.user_set.clear()
+        self.assertFalse(self._check())
+
+    def test_group_rename_invalidates(self):
+        group = Group.objects.create(name="Leads")
+        self.user.groups.add(group)
+        self.assertFalse(self._check())
+
+        group.name = "Managers"
+        group.save()
+        self.assertTrue(self._check())
@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_user
+from apps.accounts.usernames import username_check_bucket
+
+
+class UsernameAvailabilityTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.url = reverse("accounts:check_username")
+        make_user("Taken_Name", "taken@example.com")
+
+    def test_lookup_ignores_case(self):
+        response = self.client.get(self.url, {"username": "taken_NAME"})
+
+        self.assertFalse(response.json()["available"])
+
+    def test_lookup_uses_the_lower_username_expression(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url, {"username": "someone"})
+
+        sql = ctx.captured_queries[-1]["sql"]
+        self.assertIn('LOWER("auth_user"."username")', sql)
+
+    def test_cache_key_follows_the_query_lowercasing(self):
+        make_user("straße", "strasse@example.com")
+
+        # Cache "strasse" first; "straße" must not be answered from it.
+        self.assertTrue(
+            self.client.get(self.url, {"username": "strasse"}).json()["available"])
+        self.assertFalse(
+            self.client.get(self.url, {"username": "straße"}).json()["available"])
+
+    def test_answers_are_cached_until_a_user_is_saved(self):
+        self.client.get(self.url, {"username": "newcomer"})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"username": "NEWCOMER"})
+        self.assertTrue(response.json()["available"])
+        self.assertFalse(ctx.captured_queries)
+
+        User.objects.create_user(username="newcomer", password="pass12345")
+
+        response = self.client.get(self.url, {"username": "newcomer"})
+        self.assertFalse(response.json()["available"])
+
+    def test_each_ip_gets_its_own_bucket(self):
+        with mock.patch.object(username_check_bucket, "burst", 2):
+            for _ in range(2):
+                response = self.client.get(self.url, {"username": "someone"})
+                self.assertEqual(response.status_code, 200)
+
+            limited = self.client.get(self.url, {"username": "someone"})
+            other_ip = self.client.get(
+                self.url, {"username": "someone"}, REMOTE_ADDR="10.0.0.2")
+
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(limited["Retry-After"], "1")
+        self.assertEqual(other_ip.status_code, 200)
+
+    def test_clients_behind_the_router_get_separate_buckets(self):
+        with mock.patch.object(username_check_bucket, "burst", 1):
+            first = self.client.get(
+                self.url, {"username": "someone"},
+                HTTP_X_FORWARDED_FOR="198.51.100.1")
+            limited = self.client.get(
+                self.url, {"username": "someone"},
+                HTTP_X_FORWARDED_FOR="198.51.100.1")
+            second = self.client.get(
+                self.url, {"username": "someone"},
+                HTTP_X_FORWARDED_FOR="198.51.100.2")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(limited.status_code, 429)
+        self.assertEqual(second.status_code, 200)
+
+    async def test_async_client(self):
+        response = await AsyncClient().get(self.url, {"username": "TAKEN_name"})
+
+        self.assertFalse(response.json()["available"])
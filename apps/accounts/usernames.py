@@ -0,0 +1,48 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Value
+from django.db.models.functions import Lower
+
+from apps.core.cache import accounts_cache
+from apps.core.ratelimit import TokenBucket
+
+username_check_bucket = TokenBucket(
+    "username_check",
+    rate=settings.USERNAME_CHECK_RATE,
+    burst=settings.USERNAME_CHECK_BURST,
+)
+
+
+def username_cache_key(username):
+    # lower() rather than casefold(), so names the query below tells apart
+    # ("straße" and "strasse") do not share an entry.
+    digest = hashlib.sha1(username.lower().encode("utf-8")).hexdigest()
+    return f"username_taken:{digest}"
+
+
+async def ausername_taken(username):
+    """
+    Whether a user already has ``username``, ignoring case.
+
+    Both answers are cached for ``USERNAME_CHECK_CACHE_TIMEOUT`` seconds;
+    saving or deleting a user drops that username's entry.
+    """
+    key = username_cache_key(username)
+    taken = await accounts_cache.aget(key)
+    if taken is None:
+        # Written to match accounts_username_lower_idx (migration 0002);
+        # ``username__iexact`` compiles to UPPER()/LIKE and cannot use it.
+        taken = await (
+            get_user_model().objects
+            .alias(username_lower=Lower("username"))
+            .filter(username_lower=Lower(Value(username)))
+            .aexists()
+        )
+        await accounts_cache.aset(key, taken, settings.USERNAME_CHECK_CACHE_TIMEOUT)
+    return taken
+
+
+def forget_username(username):
+    accounts_cache.delete(username_cache_key(username))
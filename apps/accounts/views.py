@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, authenticate
 from django.contrib.auth.decorators import login_required
@@ -8,7 +9,11 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
 from .forms import UserRegistrationForm, UserProfileForm
-from apps.tasks.models import Task
+from .roles import ais_manager, is_manager
+from .usernames import ausername_taken, username_check_bucket
+from apps.core.ratelimit import client_ip
+from apps.tasks.models import UserTaskCounters
+from apps.tasks.stats import completion_percentage
 
 
 def custom_login_view(request):
@@ -24,12 +29,13 @@ def custom_login_view(request):
             login(request, user)
 
             remember_me = request.POST.get("remember_me") == "on"
-            request.session.set_expiry(60 * 60 * 24 * 30 if remember_me else 0)
+            request.session.set_expiry(
+                settings.SESSION_REMEMBER_ME_AGE if remember_me else 0)
 
             if next_url and next_url != "/":
                 return redirect(next_url)
 
-            if user.groups.filter(name="Managers").exists():
+            if is_manager(user):
                 return redirect("core:manager_dashboard")
             return redirect("core:employee_dashboard")
         else:
@@ -149,19 +155,14 @@ def profile_view(request):
             },
         )
 
-    user_tasks = Task.objects.filter(assigned_to=user)
+    counts = UserTaskCounters.for_user(user).as_counts()
     user_stats = {
-        "total_tasks": user_tasks.count(),
-        "completed_tasks": user_tasks.filter(status="completed").count(),
-        "pending_tasks": user_tasks.filter(status="pending").count(),
-        "in_progress_tasks": user_tasks.filter(status="in_progress").count(),
+        "total_tasks": counts["total"],
+        "completed_tasks": counts["completed"],
+        "pending_tasks": counts["pending"],
+        "in_progress_tasks": counts["in_progress"],
+        "completion_rate": completion_percentage(counts),
     }
-    user_stats["completion_rate"] = (
-        round((user_stats["completed_tasks"] /
-              user_stats["total_tasks"]) * 100, 1)
-        if user_stats["total_tasks"]
-        else 0
-    )
 
     return render(
         request,
@@ -175,7 +176,16 @@ def profile_view(request):
 
 
 @require_http_methods(["GET", "POST"])
-def check_username_availability(request):
+async def check_username_availability(request):
+    allowed, retry_after = await username_check_bucket.aconsume(client_ip(request))
+    if not allowed:
+        response = JsonResponse(
+            {"available": False, "message": "Too many requests, slow down"},
+            status=429,
+        )
+        response["Retry-After"] = str(retry_after)
+        return response
+
     if request.method == "GET":
         username = request.GET.get("username", "").strip()
     else:
@@ -191,8 +201,7 @@ def check_username_availability(request):
             }
         )
 
-    exists = User.objects.filter(username__iexact=username).exists()
-    if exists:
+    if await ausername_taken(username):
         return JsonResponse(
             {"available": False, "message": "This username is already taken"}
         )
@@ -201,8 +210,7 @@ def check_username_availability(request):
 
 @login_required
 def dashboard_redirect_view(request):
-    user = request.user
-    if user.groups.filter(name="Managers").exists():
+    if is_manager(request.user):
         return redirect("core:manager_dashboard")
     return redirect("core:employee_dashboard")
 
@@ -236,11 +244,8 @@ def change_password_view(request):
 @login_required
 def delete_account_view(request):
     if request.method == "POST":
-        pending_tasks = (
-            Task.objects.filter(
-                assigned_to=request.user, status__in=["pending", "in_progress"]
-            ).count()
-        )
+        counts = UserTaskCounters.for_user(request.user).as_counts()
+        pending_tasks = counts["pending"] + counts["in_progress"]
 
         if pending_tasks > 0:
             messages.error(
@@ -261,12 +266,12 @@ def delete_account_view(request):
         )
         return redirect("core:home")
 
-    user_tasks = Task.objects.filter(assigned_to=request.user)
+    counts = UserTaskCounters.for_user(request.user).as_counts()
     task_counts = {
-        "total": user_tasks.count(),
-        "pending": user_tasks.filter(status="pending").count(),
-        "in_progress": user_tasks.filter(status="in_progress").count(),
-        "completed": user_tasks.filter(status="completed").count(),
+        "total": counts["total"],
+        "pending": counts["pending"],
+        "in_progress": counts["in_progress"],
+        "completed": counts["completed"],
     }
 
     return render(
@@ -280,16 +285,15 @@ def delete_account_view(request):
 
 
 @login_required
-def user_list_api(request):
+async def user_list_api(request):
     """
     Minimal user list for assignment/autocomplete.
     Security: Managers only; expose non-sensitive fields only.
     """
-    is_manager = request.user.groups.filter(name="Managers").exists()
-    if not is_manager:
+    if not await ais_manager(await request.auser()):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
     users = User.objects.all().order_by("username").values(
         "id", "username", "first_name", "last_name"
     )
-    return JsonResponse({"users": list(users)}, status=200)
+    return JsonResponse({"users": [u async for u in users]}, status=200)
@@ -1 +1,9 @@
 from django.contrib import admin
+
+from .models import PlatformStats
+
+
+@admin.register(PlatformStats)
+class PlatformStatsAdmin(admin.ModelAdmin):
+    list_display = ("total_users", "total_tasks", "completed_tasks", "updated_at")
+    readonly_fields = list_display
@@ -0,0 +1,122 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+STAMPEDE_LOCK_TIMEOUT = 10
+STAMPEDE_WAIT = 2.0
+STAMPEDE_POLL_INTERVAL = 0.05
+
+
+class NamespacedCache:
+    """
+    Thin wrapper over a Django cache that prefixes every key with the
+    owning app and that app's entry in ``settings.CACHE_NAMESPACE_VERSIONS``.
+
+    Bumping an app's version orphans all of its keys at once (for example
+    after changing the shape of a cached value); the global
+    ``CACHES[...]["VERSION"]`` still applies on top. Keys may also belong to
+    a ``group`` whose generation ``invalidate_group`` replaces, for caches
+    that are cheaper to drop wholesale than to track key by key.
+    Generations are random tokens rather than counters, so if the
+    generation key itself is evicted the group starts over under a fresh
+    token instead of resurrecting entries from an earlier one.
+    """
+
+    def __init__(self, namespace, alias=DEFAULT_CACHE_ALIAS):
+        self.namespace = namespace
+        self.alias = alias
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _prefix(self):
+        versions = getattr(settings, "CACHE_NAMESPACE_VERSIONS", {})
+        return f"{self.namespace}:v{versions.get(self.namespace, 1)}"
+
+    def _generation_key(self, group):
+        return f"{self._prefix()}:_gen:{group}"
+
+    def _new_generation(self):
+        return uuid.uuid4().hex[:12]
+
+    def make_key(self, key, group=None):
+        prefix = self._prefix()
+        if group:
+            generation = self.backend.get_or_set(
+                self._generation_key(group), self._new_generation, None)
+            prefix = f"{prefix}:{group}.{generation}"
+        return f"{prefix}:{key}"
+
+    def invalidate_group(self, group):
+        self.backend.set(
+            self._generation_key(group), self._new_generation(), None)
+
+    def get(self, key, default=None):
+        return self.backend.get(self.make_key(key), default)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.backend.set(self.make_key(key), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        return self.backend.add(self.make_key(key), value, timeout)
+
+    def delete(self, key):
+        return self.backend.delete(self.make_key(key))
+
+    def delete_many(self, keys):
+        self.backend.delete_many([self.make_key(key) for key in keys])
+
+    async def aget(self, key, default=None):
+        return await self.backend.aget(self.make_key(key), default)
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT):
+        await self.backend.aset(self.make_key(key), value, timeout)
+
+    def get_or_compute(self, key, compute, timeout, group=None, grace=None):
+        """
+        Return the cached value for ``key`` or build it with ``compute()``,
+        letting only one caller at a time do the work.
+
+        Entries are kept for ``timeout + grace`` seconds (``grace`` defaults
+        to ``timeout``) but count as fresh for ``timeout`` only. Once stale,
+        the caller that wins a short ``add()`` lock recomputes while
+        everyone else keeps getting the old value. On a cold miss the
+        losers wait up to ``STAMPEDE_WAIT`` seconds for the winner before
+        computing themselves.
+        """
+        backend = self.backend
+        full_key = self.make_key(key, group)
+        lock_key = f"{full_key}:lock"
+
+        entry = backend.get(full_key)
+        if entry is not None:
+            value, fresh_until = entry
+            if time.time() < fresh_until:
+                return value
+            if not backend.add(lock_key, 1, STAMPEDE_LOCK_TIMEOUT):
+                return value
+        elif not backend.add(lock_key, 1, STAMPEDE_LOCK_TIMEOUT):
+            deadline = time.monotonic() + STAMPEDE_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(STAMPEDE_POLL_INTERVAL)
+                entry = backend.get(full_key)
+                if entry is not None:
+                    return entry[0]
+            return compute()
+
+        try:
+            value = compute()
+            grace = timeout if grace is None else grace
+            backend.set(full_key, (value, time.time() + timeout), timeout + grace)
+            return value
+        finally:
+            backend.delete(lock_key)
+
+
+tasks_cache = NamespacedCache("tasks")
+accounts_cache = NamespacedCache("accounts")
+core_cache = NamespacedCache("core")
@@ -0,0 +1,24 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def pool_stats(alias=DEFAULT_DB_ALIAS):
+    """
+    Counters from this worker's psycopg pool, or ``None`` when the alias is
+    not pooled (SQLite, persistent or PgBouncer mode).
+
+    ``requests_waiting`` is how many callers are queued right now and
+    ``requests_wait_ms`` the total time queued callers spent waiting since
+    the pool started; ``requests_wait_ms_avg`` divides that by
+    ``requests_queued``. ``requests_errors`` counts callers that gave up
+    after ``DB_POOL_TIMEOUT``.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    queued = stats.get("requests_queued", 0)
+    stats["requests_wait_ms_avg"] = (
+        round(stats.get("requests_wait_ms", 0) / queued, 1) if queued else 0.0
+    )
+    return stats
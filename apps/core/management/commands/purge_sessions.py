@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.sessions import PURGE_BATCH_SIZE, purge_expired_sessions
+
+
+class Command(BaseCommand):
+    help = "Delete expired rows from the session table in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help=f"Rows deleted per statement (default {PURGE_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, batch_size=PURGE_BATCH_SIZE, **options):
+        purged = purge_expired_sessions(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} expired session(s)."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.models import PlatformStats
+
+
+class Command(BaseCommand):
+    help = "Recompute the landing page counters from the users and tasks tables."
+
+    def handle(self, *args, **options):
+        stats = PlatformStats.refresh()
+        self.stdout.write(self.style.SUCCESS(f"Platform stats: {stats}"))
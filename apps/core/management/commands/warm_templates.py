@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.template_cache import warm_templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every template through the configured loaders and report "
+        "any that fail to parse."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Exit with an error if any template fails to compile.",
+        )
+        parser.add_argument(
+            "--include",
+            action="append",
+            metavar="PREFIX",
+            help="Only compile templates whose name starts with PREFIX.",
+        )
+
+    def handle(self, *args, strict=False, include=None, **options):
+        compiled, failures = warm_templates(include=include)
+
+        for name, path, error in failures:
+            self.stderr.write(self.style.ERROR(f"{name} ({path}): {error}"))
+
+        summary = f"Compiled {compiled} template(s), {len(failures)} failed."
+        if failures and strict:
+            raise CommandError(summary)
+        style = self.style.WARNING if failures else self.style.SUCCESS
+        self.stdout.write(style(summary))
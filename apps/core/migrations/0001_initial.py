@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-17 03:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_platform_stats(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Task = apps.get_model("tasks", "Task")
+    PlatformStats = apps.get_model("core", "PlatformStats")
+    PlatformStats.objects.update_or_create(
+        pk=1,
+        defaults={
+            "total_users": User.objects.count(),
+            "total_tasks": Task.objects.count(),
+            "completed_tasks": Task.objects.filter(status="completed").count(),
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("tasks", "0005_task_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("total_users", models.IntegerField(default=0)),
+                ("total_tasks", models.IntegerField(default=0)),
+                ("completed_tasks", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Platform Statistics",
+                "verbose_name_plural": "Platform Statistics",
+            },
+        ),
+        migrations.RunPython(populate_platform_stats, migrations.RunPython.noop),
+    ]
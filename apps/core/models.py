@@ -1 +1,57 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
+
+from apps.tasks.models import Task
+
+
+class PlatformStats(models.Model):
+    """
+    Single-row summary of the public landing page counters.
+
+    ``load`` recomputes the row once it is older than
+    ``PLATFORM_STATS_MAX_AGE`` seconds, so writes to users and tasks never
+    touch it; ``refresh_platform_stats`` can also be run on a schedule.
+    """
+
+    SINGLETON_PK = 1
+
+    total_users = models.IntegerField(default=0)
+    total_tasks = models.IntegerField(default=0)
+    completed_tasks = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Platform Statistics"
+        verbose_name_plural = "Platform Statistics"
+
+    def __str__(self):
+        return (
+            f"{self.total_users} users, {self.total_tasks} tasks, "
+            f"{self.completed_tasks} completed"
+        )
+
+    @classmethod
+    def compute(cls):
+        return {
+            "total_users": User.objects.count(),
+            "total_tasks": Task.objects.count(),
+            "completed_tasks": Task.objects.filter(status="completed").count(),
+        }
+
+    @classmethod
+    def refresh(cls):
+        stats, _ = cls.objects.update_or_create(
+            pk=cls.SINGLETON_PK, defaults=cls.compute())
+        return stats
+
+    @classmethod
+    def load(cls):
+        stats = cls.objects.filter(pk=cls.SINGLETON_PK).first()
+        max_age = timedelta(seconds=settings.PLATFORM_STATS_MAX_AGE)
+        if stats is None or stats.updated_at < timezone.now() - max_age:
+            return cls.refresh()
+        return stats
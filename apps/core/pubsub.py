@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_QUEUE_SIZE = 100
+BROKER_RETRY_DELAY = 5
+
+
+class Subscription:
+    """
+    One listener's queue, bound to the event loop that created it.
+
+    ``deliver`` may be called from any thread; when the queue is full the
+    oldest message is dropped, so a stalled client cannot grow memory.
+    """
+
+    def __init__(self, channels, maxsize=SUBSCRIPTION_QUEUE_SIZE):
+        self.channels = tuple(channels)
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize)
+
+    def deliver(self, channel, message):
+        try:
+            self._loop.call_soon_threadsafe(self._put, channel, message)
+        except RuntimeError:
+            # The loop closed under a subscription that never unregistered.
+            pass
+
+    def _put(self, channel, message):
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait((channel, message))
+
+    async def get(self, timeout=None):
+        """Next ``(channel, message)``, or ``None`` after ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """
+    Per-process fan-out from channels to subscriptions.
+
+    ``publish`` hands the message to the broker, which delivers it back
+    through ``dispatch`` on every process that runs a hub; local listeners
+    are plain queues, so an idle stream is one parked coroutine.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+        self.broker = None
+
+    def publish(self, channel, message):
+        self.broker.publish(channel, message)
+
+    def dispatch(self, channel, message):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channels, maxsize=SUBSCRIPTION_QUEUE_SIZE):
+        await self.broker.start()
+        subscription = Subscription(channels, maxsize)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscriptions[channel].add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                for channel in subscription.channels:
+                    listeners = self._subscriptions[channel]
+                    listeners.discard(subscription)
+                    if not listeners:
+                        del self._subscriptions[channel]
+
+
+class LocalBroker:
+    """
+    Delivers straight to this process's hub. Enough for one ASGI process
+    and for tests; with several workers use ``RedisBroker``.
+    """
+
+    def __init__(self, hub, **options):
+        self.hub = hub
+
+    def publish(self, channel, message):
+        self.hub.dispatch(channel, message)
+
+    async def start(self):
+        pass
+
+
+class RedisBroker:
+    """
+    Relays events through Redis ``PUBLISH``/``PSUBSCRIBE`` so every worker
+    process sees every event. Works with any server speaking the Redis
+    protocol (Redis, Valkey, KeyDB). Each process holds one subscriber
+    connection, started on its event loop by the first stream that opens.
+    """
+
+    def __init__(self, hub, url, prefix="etm:events:"):
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImproperlyConfigured(
+                "EVENTS_BROKER RedisBroker needs the redis package") from exc
+        self.hub = hub
+        self.url = url
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._listener = None
+
+    def publish(self, channel, message):
+        self._client.publish(
+            self.prefix + channel, json.dumps(message, cls=DjangoJSONEncoder))
+
+    async def start(self):
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self):
+        from redis import asyncio as aioredis
+
+        while True:
+            try:
+                client = aioredis.Redis.from_url(self.url)
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{self.prefix}*")
+                    async for item in pubsub.listen():
+                        if item["type"] != "pmessage":
+                            continue
+                        channel = item["channel"].decode()[len(self.prefix):]
+                        self.hub.dispatch(channel, json.loads(item["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event broker connection lost; retrying")
+                await asyncio.sleep(BROKER_RETRY_DELAY)
+
+
+@lru_cache(maxsize=None)
+def get_hub():
+    """The process-wide hub, wired to ``settings.EVENTS_BROKER``."""
+    hub = EventHub()
+    config = dict(settings.EVENTS_BROKER)
+    broker_class = import_string(config.pop("BACKEND"))
+    hub.broker = broker_class(hub, **{k.lower(): v for k, v in config.items()})
+    return hub
+
+
+def publish(channel, message):
+    get_hub().publish(channel, message)
@@ -0,0 +1,72 @@
+import math
+import time
+
+from django.conf import settings
+
+from .cache import core_cache
+
+
+class TokenBucket:
+    """
+    Token-bucket limiter kept in the shared cache, one bucket per key.
+
+    A bucket holds up to ``burst`` tokens and refills at ``rate`` tokens
+    per second; each allowed call spends one. The state is read and
+    written without a lock, so a burst of simultaneous requests from one
+    key can overspend by a token or two. That is fine for throttling
+    crawlers and keeps the check at one cache read and one write.
+    """
+
+    def __init__(self, name, rate, burst, cache=core_cache):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.cache = cache
+
+    def _key(self, key):
+        return f"bucket:{self.name}:{key}"
+
+    def _spend(self, state, now):
+        """Return ``(allowed, new_state, retry_after)`` for one request."""
+        tokens, stamp = state if state else (self.burst, now)
+        tokens = min(self.burst, tokens + (now - stamp) * self.rate)
+        if tokens >= 1:
+            return True, (tokens - 1, now), 0
+        return False, (tokens, now), math.ceil((1 - tokens) / self.rate)
+
+    @property
+    def _ttl(self):
+        # An untouched bucket is full again after this long.
+        return math.ceil(self.burst / self.rate) + 1
+
+    def consume(self, key, now=None):
+        """Spend a token for ``key``; returns ``(allowed, retry_after)``."""
+        now = time.time() if now is None else now
+        allowed, state, retry_after = self._spend(self.cache.get(self._key(key)), now)
+        self.cache.set(self._key(key), state, self._ttl)
+        return allowed, retry_after
+
+    async def aconsume(self, key, now=None):
+        now = time.time() if now is None else now
+        state = await self.cache.aget(self._key(key))
+        allowed, state, retry_after = self._spend(state, now)
+        await self.cache.aset(self._key(key), state, self._ttl)
+        return allowed, retry_after
+
+
+def client_ip(request):
+    """
+    The caller's address. Behind ``RATELIMIT_TRUSTED_PROXIES`` proxies it
+    is read from ``X-Forwarded-For``, counting entries from the right so a
+    client cannot spoof it by sending the header itself.
+    """
+    proxies = getattr(settings, "RATELIMIT_TRUSTED_PROXIES", 1)
+    if proxies:
+        forwarded = [
+            part.strip()
+            for part in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+            if part.strip()
+        ]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
@@ -0,0 +1,25 @@
+from django.contrib.sessions.models import Session
+from django.utils import timezone
+
+PURGE_BATCH_SIZE = 1000
+
+
+def purge_expired_sessions(batch_size=PURGE_BATCH_SIZE, now=None):
+    """
+    Delete expired ``django_session`` rows in primary-key batches and return
+    how many went.
+
+    Unlike ``clearsessions`` this never issues one unbounded DELETE, so a
+    table grown by 30-day "remember me" logins is trimmed without holding a
+    long lock. Rows are purged whatever ``SESSION_ENGINE`` is active, which
+    also clears what is left behind after switching to the cache or
+    signed-cookie engine.
+    """
+    now = now or timezone.now()
+    expired = Session.objects.filter(expire_date__lt=now)
+    purged = 0
+    while True:
+        keys = list(expired.values_list("pk", flat=True)[:batch_size])
+        if not keys:
+            return purged
+        purged += Session.objects.filter(pk__in=keys).delete()[0]
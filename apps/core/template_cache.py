@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+TEMPLATE_SUFFIXES = (".html", ".txt", ".xml")
+
+
+def _template_names(backend):
+    """
+    Yield ``(name, path)`` for every template file the backend's loaders
+    can see, project ``DIRS`` first, skipping names shadowed by an earlier
+    directory exactly as the loaders would.
+    """
+    seen = set()
+    for loader in backend.engine.template_loaders:
+        for directory in loader.get_dirs():
+            root = Path(directory)
+            if not root.is_dir():
+                continue
+            for path in sorted(root.rglob("*")):
+                if path.suffix not in TEMPLATE_SUFFIXES or not path.is_file():
+                    continue
+                name = path.relative_to(root).as_posix()
+                if name not in seen:
+                    seen.add(name)
+                    yield name, path
+
+
+def warm_templates(include=None):
+    """
+    Parse every template so the cached loader holds the compiled result.
+
+    ``include`` optionally limits the work to names starting with one of
+    the given prefixes. Returns ``(compiled, failures)`` where ``failures``
+    is a list of ``(name, path, error)``.
+    """
+    compiled = 0
+    failures = []
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name, path in _template_names(backend):
+            if include and not name.startswith(tuple(include)):
+                continue
+            try:
+                backend.get_template(name)
+            except TemplateSyntaxError as exc:
+                failures.append((name, path, exc))
+            else:
+                compiled += 1
+    return compiled, failures
@@ -0,0 +1,150 @@
+import threading
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.core.cache import NamespacedCache
+from apps.tasks.models import Task
+from apps.tasks.stats import cached_task_counts
+from apps.tasks.transitions import bulk_transition
+
+
+class NamespacedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_namespaces_do_not_collide(self):
+        tasks = NamespacedCache("tasks")
+        accounts = NamespacedCache("accounts")
+
+        tasks.set("key", "tasks value")
+        accounts.set("key", "accounts value")
+
+        self.assertEqual(tasks.get("key"), "tasks value")
+        self.assertEqual(accounts.get("key"), "accounts value")
+
+    def test_namespace_version_orphans_old_keys(self):
+        ns = NamespacedCache("tasks")
+        ns.set("key", "old")
+
+        with override_settings(CACHE_NAMESPACE_VERSIONS={"tasks": 2}):
+            self.assertIsNone(ns.get("key"))
+            ns.set("key", "new")
+            self.assertEqual(ns.get("key"), "new")
+
+        self.assertEqual(ns.get("key"), "old")
+
+    def test_invalidate_group_only_drops_that_group(self):
+        ns = NamespacedCache("tasks")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(ns.get_or_compute("a", compute, 60, group="g"), 1)
+        self.assertEqual(ns.get_or_compute("a", compute, 60, group="g"), 1)
+        ns.set("plain", "kept")
+
+        ns.invalidate_group("g")
+
+        self.assertEqual(ns.get_or_compute("a", compute, 60, group="g"), 2)
+        self.assertEqual(ns.get("plain"), "kept")
+
+    def test_evicted_generation_does_not_resurrect_old_entries(self):
+        ns = NamespacedCache("tasks")
+        ns.get_or_compute("a", lambda: "first", 60, group="g")
+        ns.invalidate_group("g")
+        ns.get_or_compute("a", lambda: "second", 60, group="g")
+
+        cache.delete(ns._generation_key("g"))
+
+        self.assertEqual(
+            ns.get_or_compute("a", lambda: "third", 60, group="g"), "third")
+
+    def test_stale_value_is_served_while_another_caller_refreshes(self):
+        ns = NamespacedCache("core")
+        ns.get_or_compute("k", lambda: "old", 60)
+        full_key = ns.make_key("k")
+        value, _ = cache.get(full_key)
+        cache.set(full_key, (value, 0), 120)
+        cache.add(f"{full_key}:lock", 1, 10)
+
+        refresh = mock.Mock(return_value="new")
+        self.assertEqual(ns.get_or_compute("k", refresh, 60), "old")
+        refresh.assert_not_called()
+
+        cache.delete(f"{full_key}:lock")
+        self.assertEqual(ns.get_or_compute("k", refresh, 60), "new")
+        refresh.assert_called_once()
+
+    def test_concurrent_cold_misses_compute_once(self):
+        ns = NamespacedCache("core")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        results = []
+        winner = threading.Thread(
+            target=lambda: results.append(
+                ns.get_or_compute("cold", slow_compute, 60)))
+        winner.start()
+        started.wait(5)
+
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                ns.get_or_compute("cold", slow_compute, 60)))
+        waiter.start()
+        release.set()
+        winner.join(5)
+        waiter.join(5)
+
+        self.assertEqual(results, ["value", "value"])
+        self.assertEqual(len(calls), 1)
+
+
+class StatsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.manager = make_user("boss", "boss@example.com", is_manager=True)
+        self.client.force_login(self.manager)
+
+    def test_stats_api_is_cached_until_a_task_changes(self):
+        task = make_task(assigned_to=self.manager, created_by=self.manager)
+        url = reverse("tasks:task_stats_api")
+
+        self.assertEqual(self.client.get(url).json()["pending_tasks"], 1)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if Task._meta.db_table in q["sql"]])
+
+        task.status = "completed"
+        task.save()
+
+        payload = self.client.get(url).json()
+        self.assertEqual(payload["pending_tasks"], 0)
+        self.assertEqual(payload["completed_tasks"], 1)
+
+    def test_bulk_transition_invalidates_stats(self):
+        task = make_task(assigned_to=self.manager, created_by=self.manager)
+        counts = cached_task_counts("all", Task.objects.all())
+        self.assertEqual(counts["in_progress"], 0)
+
+        bulk_transition([task.pk], "in_progress")
+
+        counts = cached_task_counts("all", Task.objects.all())
+        self.assertEqual(counts["in_progress"], 1)
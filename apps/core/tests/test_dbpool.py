@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.db import connections
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_user
+from apps.core.dbpool import pool_stats
+
+
+class PoolStatsTests(TestCase):
+    def test_unpooled_connection_reports_none(self):
+        self.assertIsNone(pool_stats())
+
+    def test_average_wait_is_derived_from_queued_requests(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {
+            "pool_size": 4,
+            "requests_num": 40,
+            "requests_queued": 8,
+            "requests_wait_ms": 100,
+            "requests_waiting": 1,
+        }
+        with mock.patch.object(
+            type(connections["default"]), "pool", pool, create=True
+        ):
+            stats = pool_stats()
+
+        self.assertEqual(stats["requests_wait_ms_avg"], 12.5)
+        self.assertEqual(stats["requests_waiting"], 1)
+
+
+class DbPoolStatsViewTests(TestCase):
+    def setUp(self):
+        self.url = reverse("core:db_pool_stats")
+
+    def test_requires_staff(self):
+        user = make_user("plain", "plain@example.com")
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()["success"])
+
+    def test_reports_mode_and_pool(self):
+        staff = make_user("ops", "ops@example.com")
+        staff.is_staff = True
+        staff.save()
+        self.client.force_login(staff)
+
+        payload = self.client.get(self.url).json()
+
+        self.assertEqual(payload["mode"], "persistent")
+        self.assertEqual(payload["vendor"], "sqlite")
+        self.assertIsNone(payload["pool"])
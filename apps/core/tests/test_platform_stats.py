@@ -0,0 +1,62 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.core.models import PlatformStats
+
+User = get_user_model()
+
+
+class PlatformStatsTests(TestCase):
+    def _stats(self):
+        stats = PlatformStats.load()
+        return stats.total_users, stats.total_tasks, stats.completed_tasks
+
+    def test_writes_do_not_touch_the_row_until_it_expires(self):
+        PlatformStats.refresh()
+
+        with CaptureQueriesContext(connection) as ctx:
+            task = make_task()
+            task.status = "completed"
+            task.save()
+            task.delete()
+            make_task(assigned_to=task.assigned_to)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "core_platformstats" in q["sql"]]
+        )
+        self.assertEqual(self._stats(), (0, 0, 0))
+
+        PlatformStats.objects.update(
+            updated_at=timezone.now() - timedelta(minutes=5))
+        self.assertEqual(self._stats(), (1, 1, 0))
+
+    def test_refresh_repairs_drift(self):
+        make_task(status="completed")
+        PlatformStats.objects.update(total_tasks=99, completed_tasks=0)
+
+        call_command("refresh_platform_stats", stdout=StringIO())
+        self.assertEqual(self._stats(), (1, 1, 1))
+
+    def test_home_view_skips_count_queries(self):
+        make_task()
+        PlatformStats.objects.all().delete()
+        cache.clear()
+        self.client.get(reverse("core:home"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get(reverse("core:home"))
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.context["total_tasks"], 1)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()]
+        )
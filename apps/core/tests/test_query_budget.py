@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task
+from apps.tasks.stats import team_performance
+
+User = get_user_model()
+
+MANAGER_DASHBOARD_QUERY_BUDGET = 8
+
+
+class ManagerDashboardQueryBudgetTests(TestCase):
+    def setUp(self):
+        self.manager = User.objects.create_user(
+            username="mgr", password="pass12345")
+        self.manager.userprofile.role = "manager"
+        self.manager.userprofile.save()
+        self.employees_group, _ = Group.objects.get_or_create(
+            name="Employees")
+
+    def _add_employees(self, count, start=0):
+        employees = []
+        for i in range(start, start + count):
+            emp = User.objects.create(username=f"emp{i}")
+            emp.groups.add(self.employees_group)
+            employees.append(emp)
+        return employees
+
+    def _dashboard_queries(self):
+        self.client.force_login(self.manager)
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get(reverse("core:manager_dashboard"))
+        self.assertEqual(r.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_query_count_independent_of_team_size(self):
+        for emp in self._add_employees(3):
+            make_task(assigned_to=emp, created_by=self.manager)
+        small = self._dashboard_queries()
+
+        for emp in self._add_employees(30, start=3):
+            make_task(assigned_to=emp, created_by=self.manager)
+        large = self._dashboard_queries()
+
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, MANAGER_DASHBOARD_QUERY_BUDGET)
+
+    def test_team_performance_ranked_and_cut_in_sql(self):
+        best, middle, idle = self._add_employees(3)
+        best.first_name, best.last_name = "Ada", "Lovelace"
+        best.save()
+        make_task(assigned_to=best, created_by=self.manager,
+                  status="completed")
+        make_task(assigned_to=middle, created_by=self.manager,
+                  status="completed")
+        make_task(assigned_to=middle, created_by=self.manager)
+
+        with self.assertNumQueries(1):
+            rows = team_performance(limit=2)
+
+        self.assertEqual(
+            rows,
+            [
+                {"name": "Ada Lovelace", "assigned_count": 1,
+                 "completed_count": 1, "completion_rate": 100.0},
+                {"name": "emp1", "assigned_count": 2,
+                 "completed_count": 1, "completion_rate": 50.0},
+            ],
+        )
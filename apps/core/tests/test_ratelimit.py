@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core.ratelimit import TokenBucket, client_ip
+
+
+class TokenBucketTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_burst_then_refill(self):
+        bucket = TokenBucket("test", rate=0.5, burst=2)
+
+        self.assertEqual(bucket.consume("ip", now=100), (True, 0))
+        self.assertEqual(bucket.consume("ip", now=100), (True, 0))
+        self.assertEqual(bucket.consume("ip", now=100), (False, 2))
+        self.assertEqual(bucket.consume("ip", now=102), (True, 0))
+        self.assertTrue(bucket.consume("other", now=102)[0])
+
+
+class ClientIpTests(SimpleTestCase):
+    def test_forwarded_for_is_only_trusted_behind_proxies(self):
+        request = RequestFactory().get(
+            "/", REMOTE_ADDR="10.0.0.1",
+            HTTP_X_FORWARDED_FOR="6.6.6.6, 203.0.113.7")
+
+        with override_settings(RATELIMIT_TRUSTED_PROXIES=0):
+            self.assertEqual(client_ip(request), "10.0.0.1")
+        with override_settings(RATELIMIT_TRUSTED_PROXIES=1):
+            self.assertEqual(client_ip(request), "203.0.113.7")
+
+    def test_short_forwarded_for_falls_back_to_the_peer(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="10.0.0.1")
+
+        with override_settings(RATELIMIT_TRUSTED_PROXIES=1):
+            self.assertEqual(client_ip(request), "10.0.0.1")
@@ -0,0 +1,90 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_user
+from apps.core.sessions import purge_expired_sessions
+
+
+def _session(expires_in):
+    store = SessionStore()
+    store["marker"] = True
+    store.set_expiry(expires_in)
+    store.create()
+    return store.session_key
+
+
+class PurgeExpiredSessionsTests(TestCase):
+    def test_purges_only_expired_rows_in_batches(self):
+        live = _session(3600)
+        for _ in range(5):
+            _session(3600)
+        Session.objects.exclude(pk=live).update(
+            expire_date=timezone.now() - timedelta(seconds=1))
+
+        with CaptureQueriesContext(connection) as ctx:
+            purged = purge_expired_sessions(batch_size=2)
+
+        self.assertEqual(purged, 5)
+        self.assertEqual(list(Session.objects.values_list("pk", flat=True)), [live])
+        deletes = [q for q in ctx.captured_queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 3)
+
+    def test_command_reports_count(self):
+        key = _session(3600)
+        Session.objects.filter(pk=key).update(
+            expire_date=timezone.now() - timedelta(days=1))
+
+        out = StringIO()
+        call_command("purge_sessions", stdout=out)
+
+        self.assertIn("Purged 1 expired session(s).", out.getvalue())
+        self.assertFalse(Session.objects.exists())
+
+
+class SessionEngineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = make_user("sessuser", "sess@example.com")
+
+    def _session_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [q for q in ctx.captured_queries if "django_session" in q["sql"]]
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+    def test_cached_db_serves_warm_requests_without_session_queries(self):
+        self.client.force_login(self.user)
+        self.assertEqual(
+            self._session_queries(reverse("core:employee_dashboard")), [])
+
+    @override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+    def test_signed_cookie_sessions_survive_requests(self):
+        self.client.force_login(self.user)
+        url = reverse("core:employee_dashboard")
+        self.assertEqual(self._session_queries(url), [])
+        self.assertFalse(Session.objects.exists())
+
+    @override_settings(SESSION_REMEMBER_ME_AGE=3600)
+    def test_remember_me_uses_configured_age(self):
+        self.client.post(
+            reverse("accounts:login"),
+            {
+                "username": "sessuser",
+                "password": "pass12345",
+                "remember_me": "on",
+            },
+        )
+        self.assertEqual(self.client.session.get_expiry_age(), 3600)
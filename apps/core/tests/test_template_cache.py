@@ -0,0 +1,62 @@
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.template_cache import warm_templates
+
+
+def _cached_templates(tmpdir):
+    return [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [tmpdir],
+            "OPTIONS": {
+                "loaders": [
+                    (
+                        "django.template.loaders.cached.Loader",
+                        ["django.template.loaders.filesystem.Loader"],
+                    )
+                ]
+            },
+        }
+    ]
+
+
+class WarmTemplatesTests(SimpleTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        root = Path(self.tmpdir)
+        (root / "pages").mkdir()
+        (root / "pages" / "ok.html").write_text("<p>{{ value|upper }}</p>")
+        (root / "pages" / "broken.html").write_text("{% if %}")
+        (root / "notes.md").write_text("not a template")
+
+    def test_project_templates_all_compile(self):
+        compiled, failures = warm_templates(include=["tasks/", "core/"])
+        self.assertGreaterEqual(compiled, 5)
+        self.assertEqual(failures, [])
+
+    def test_compiled_templates_are_kept_and_failures_reported(self):
+        with override_settings(TEMPLATES=_cached_templates(self.tmpdir)):
+            compiled, failures = warm_templates()
+            loader = engines["django"].engine.template_loaders[0]
+
+            self.assertEqual(compiled, 1)
+            self.assertEqual([name for name, _, _ in failures], ["pages/broken.html"])
+            self.assertIn("pages/ok.html", loader.get_template_cache)
+
+    def test_command_strict_mode(self):
+        with override_settings(TEMPLATES=_cached_templates(self.tmpdir)):
+            out, err = StringIO(), StringIO()
+            call_command("warm_templates", stdout=out, stderr=err)
+            self.assertIn("Compiled 1 template(s), 1 failed.", out.getvalue())
+            self.assertIn("pages/broken.html", err.getvalue())
+
+            with self.assertRaises(CommandError):
+                call_command("warm_templates", "--strict", stdout=out, stderr=err)
@@ -18,4 +18,5 @@ urlpatterns = [
     ),
     path("about/", views.about_view, name="about"),
     path("contact/", views.contact_view, name="contact"),
+    path("ops/db-pool/", views.db_pool_stats_view, name="db_pool_stats"),
 ]
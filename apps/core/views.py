@@ -1,29 +1,51 @@
 from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.models import User
+from django.db import connection
 from django.db.models import Q
+from django.http import JsonResponse
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.utils import timezone
 
-from apps.tasks.models import Task
+from apps.accounts.roles import is_manager
+from apps.tasks.models import Task, UserTaskCounters
+from apps.tasks.stats import (
+    aggregate_task_counts,
+    cached_team_performance,
+    completion_percentage,
+    daily_progress,
+)
+
+from .cache import core_cache
+from .dbpool import pool_stats
+from .models import PlatformStats
+
+
+def _recent_tasks():
+    return core_cache.get_or_compute(
+        "home:recent_tasks",
+        lambda: list(
+            Task.objects.select_related(
+                "assigned_to",
+                "created_by",
+            ).order_by("-created_at")[:5]
+        ),
+        settings.HOME_RECENT_TASKS_TTL,
+    )
 
 
 def home_view(request):
-    total_users = User.objects.count()
-    total_tasks = Task.objects.count()
-    completed_tasks = Task.objects.filter(status="completed").count()
-
-    recent_tasks = Task.objects.select_related(
-        "assigned_to",
-        "created_by",
-    ).order_by("-created_at")[:5]
+    stats = PlatformStats.load()
 
     context = {
-        "total_users": total_users,
-        "total_tasks": total_tasks,
-        "completed_tasks": completed_tasks,
-        "recent_tasks": recent_tasks,
+        "total_users": stats.total_users,
+        "total_tasks": stats.total_tasks,
+        "completed_tasks": stats.completed_tasks,
+        # Called lazily by the template engine, so the query (or cache hit)
+        # only happens when the page actually renders the list.
+        "recent_tasks": _recent_tasks,
         "platform_name": "Employee Task Manager",
     }
 
@@ -32,66 +54,32 @@ def home_view(request):
 
 @login_required
 def dashboard_view(request):
-    user = request.user
-    is_manager = (
-        getattr(user, "userprofile", None) and user.userprofile.is_manager
-    )
     return redirect(
-        "core:manager_dashboard" if is_manager else "core:employee_dashboard"
+        "core:manager_dashboard"
+        if is_manager(request.user)
+        else "core:employee_dashboard"
     )
 
 
 @login_required
 def manager_dashboard_view(request):
-    user = request.user
-    is_manager = (
-        getattr(user, "userprofile", None) and user.userprofile.is_manager
-    )
-    if not is_manager:
+    if not is_manager(request.user):
         return redirect("core:employee_dashboard")
 
     all_tasks = Task.objects.select_related("assigned_to", "created_by")
 
-    total_tasks = all_tasks.count()
-    pending_count = all_tasks.filter(status="pending").count()
-    in_progress_count = all_tasks.filter(status="in_progress").count()
-    completed_count = all_tasks.filter(status="completed").count()
-    overdue_count = all_tasks.filter(
-        due_date__lt=timezone.now(),
-        status__in=["pending", "in_progress"],
-    ).count()
+    counts = aggregate_task_counts(all_tasks)
 
     recent_activities = all_tasks.order_by("-created_at")[:10]
 
-    team_performance = []
-    employees = User.objects.filter(groups__name="Employees")
-    for employee in employees:
-        employee_tasks = all_tasks.filter(assigned_to=employee)
-        assigned_count = employee_tasks.count()
-        completed_count_emp = employee_tasks.filter(status="completed").count()
-        completion_rate = (
-            round((completed_count_emp / assigned_count) * 100, 1)
-            if assigned_count
-            else 0
-        )
-        team_performance.append(
-            {
-                "name": employee.get_full_name() or employee.username,
-                "assigned_count": assigned_count,
-                "completed_count": completed_count_emp,
-                "completion_rate": completion_rate,
-            }
-        )
-    team_performance.sort(key=lambda x: x["completion_rate"], reverse=True)
-
     context = {
-        "total_tasks": total_tasks,
-        "pending_tasks": pending_count,
-        "in_progress_tasks": in_progress_count,
-        "completed_tasks": completed_count,
-        "overdue_tasks": overdue_count,
+        "total_tasks": counts["total"],
+        "pending_tasks": counts["pending"],
+        "in_progress_tasks": counts["in_progress"],
+        "completed_tasks": counts["completed"],
+        "overdue_tasks": counts["overdue"],
         "recent_activities": recent_activities,
-        "team_performance": team_performance[:10],
+        "team_performance": cached_team_performance(limit=10),
         "dashboard_type": "manager",
     }
     return render(request, "core/manager_dashboard.html", context)
@@ -103,28 +91,19 @@ def employee_dashboard_view(request):
 
     my_tasks = Task.objects.filter(assigned_to=user)
 
-    my_tasks_count = my_tasks.count()
-    pending_count = my_tasks.filter(status="pending").count()
-    in_progress_count = my_tasks.filter(status="in_progress").count()
-    completed_count = my_tasks.filter(status="completed").count()
-
-    overdue_count = my_tasks.filter(
-        due_date__lt=timezone.now(),
-        status__in=["pending", "in_progress"],
+    counts = UserTaskCounters.for_user(user).as_counts()
+    # Overdue depends on the clock, so it cannot live in the counters row;
+    # this count is served by the assignee/status index.
+    counts["overdue"] = my_tasks.filter(
+        due_date__lt=timezone.now(), status__in=Task.OPEN_STATUSES
     ).count()
 
-    completion_percentage = (
-        round((completed_count / my_tasks_count) * 100, 1)
-        if my_tasks_count
-        else 0
-    )
-
     today = timezone.now().date()
     todays_tasks = my_tasks.filter(
         Q(due_date__date=today)
         | Q(
             due_date__lt=timezone.now(),
-            status__in=["pending", "in_progress"],
+            status__in=Task.OPEN_STATUSES,
         )
     ).order_by("due_date", "priority")[:5]
 
@@ -132,43 +111,42 @@ def employee_dashboard_view(request):
         updated_at__gte=timezone.now() - timedelta(days=7)
     ).order_by("-updated_at")[:5]
 
-    weekly_progress = []
-    for i in range(7):
-        day = today - timedelta(days=6 - i)
-        day_tasks = my_tasks.filter(due_date__date=day)
-        total_day_tasks = day_tasks.count()
-        completed_day_tasks = day_tasks.filter(status="completed").count()
-        completion_rate = (
-            round((completed_day_tasks / total_day_tasks) * 100)
-            if total_day_tasks
-            else 0
-        )
-
-        weekly_progress.append(
-            {
-                "day_name": day.strftime("%a"),
-                "date": day,
-                "total": total_day_tasks,
-                "completed": completed_day_tasks,
-                "completion_rate": completion_rate,
-            }
-        )
+    weekly_progress = daily_progress(my_tasks, days=7, end=today)
 
     context = {
-        "my_tasks_count": my_tasks_count,
-        "pending_count": pending_count,
-        "in_progress_count": in_progress_count,
-        "completed_count": completed_count,
-        "overdue_count": overdue_count,
-        "completion_percentage": completion_percentage,
+        "my_tasks_count": counts["total"],
+        "pending_count": counts["pending"],
+        "in_progress_count": counts["in_progress"],
+        "completed_count": counts["completed"],
+        "overdue_count": counts["overdue"],
+        "completion_percentage": completion_percentage(counts),
         "todays_tasks": todays_tasks,
         "recent_activities": recent_activities,
         "weekly_progress": weekly_progress,
         "dashboard_type": "employee",
+        "events_url": (
+            reverse("tasks:task_events") if settings.EVENTS_STREAM else None
+        ),
     }
     return render(request, "core/employee_dashboard.html", context)
 
 
+@login_required
+def db_pool_stats_view(request):
+    """Connection pool counters for the worker that serves the request."""
+    if not request.user.is_staff:
+        return JsonResponse(
+            {"success": False, "error": "Staff access required"}, status=403)
+
+    return JsonResponse(
+        {
+            "mode": settings.DB_POOL_MODE,
+            "vendor": connection.vendor,
+            "pool": pool_stats(),
+        }
+    )
+
+
 def about_view(request):
     context = {
         "page_title": "About Employee Task Manager",
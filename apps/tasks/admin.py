@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Task, TaskComment
+from .models import Task, TaskComment, UserTaskCounters
 
 
 @admin.register(Task)
@@ -85,3 +85,18 @@ class TaskCommentAdmin(admin.ModelAdmin):
         return text[:50] + "..." if len(text) > 50 else text
 
     comment_preview.short_description = "Comment Preview"
+
+
+@admin.register(UserTaskCounters)
+class UserTaskCountersAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "total",
+        "pending",
+        "in_progress",
+        "completed",
+        "cancelled",
+        "updated_at",
+    )
+    search_fields = ("user__username",)
+    readonly_fields = list_display
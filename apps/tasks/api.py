@@ -0,0 +1,136 @@
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Task
+from .stats import local_day_bounds
+
+# Public field name -> values() lookup. ``id`` and ``created_at`` are always
+# fetched because the pagination cursor is built from them.
+TASK_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "description": "description",
+    "status": "status",
+    "priority": "priority",
+    "assignee_id": "assigned_to_id",
+    "assignee": "assigned_to__username",
+    "created_by_id": "created_by_id",
+    "created_by": "created_by__username",
+    "due_date": "due_date",
+    "estimated_hours": "estimated_hours",
+    "notes": "notes",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "completed_at": "completed_at",
+    "comment_count": "comment_count",
+}
+
+COMMENT_FIELDS = {
+    "id": "id",
+    "task_id": "task_id",
+    "user_id": "user_id",
+    "user": "user__username",
+    "user_first_name": "user__first_name",
+    "user_last_name": "user__last_name",
+    "comment": "comment",
+    "created_at": "created_at",
+}
+
+KEY_FIELDS = ("id", "created_at")
+
+
+class ApiError(ValueError):
+    def __init__(self, message, status=400, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors
+
+    def as_dict(self):
+        payload = {"success": False, "error": str(self)}
+        if self.errors:
+            payload["errors"] = self.errors
+        return payload
+
+
+def parse_fields(value, spec):
+    """
+    Turn a ``?fields=a,b`` value into the list of public names to return.
+
+    An empty value selects every field in ``spec``; unknown names raise
+    ``ApiError``.
+    """
+    if not value:
+        return list(spec)
+    names = list(dict.fromkeys(n.strip() for n in value.split(",") if n.strip()))
+    unknown = [n for n in names if n not in spec]
+    if unknown:
+        raise ApiError(f"Unknown field(s): {', '.join(unknown)}")
+    return names
+
+
+def select_fields(queryset, names, spec):
+    """``values()`` over only the columns (and joins) the caller asked for."""
+    lookups = [spec[name] for name in names]
+    lookups += [key for key in KEY_FIELDS if key not in lookups]
+    return queryset.values(*lookups)
+
+
+def serialize(row, names, spec):
+    return {name: row[spec[name]] for name in names}
+
+
+def _parse_choice_list(value, choices, label):
+    values = [v.strip() for v in value.split(",") if v.strip()]
+    allowed = {key for key, _ in choices}
+    bad = [v for v in values if v not in allowed]
+    if bad:
+        raise ApiError(f"Invalid {label}: {', '.join(bad)}")
+    return values
+
+
+def _parse_due_bound(value, label, end_of_day=False):
+    try:
+        day = parse_date(value)
+        moment = None if day else parse_datetime(value)
+    except ValueError:
+        day = moment = None
+    if day is not None:
+        start, end = local_day_bounds(day)
+        return end if end_of_day else start
+    if moment is None:
+        raise ApiError(f"Invalid {label}: expected an ISO date or datetime")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, timezone.get_current_timezone())
+    return moment
+
+
+def task_filters(params):
+    """
+    Build a ``Q`` from the list endpoint's query parameters.
+
+    ``status`` and ``priority`` take comma-separated values, ``assignee`` a
+    user id, and ``due_after``/``due_before`` an ISO date or datetime. A
+    bare ``due_before`` date includes that whole day.
+    """
+    condition = Q()
+
+    if params.get("status"):
+        condition &= Q(status__in=_parse_choice_list(
+            params["status"], Task.STATUS_CHOICES, "status"))
+    if params.get("priority"):
+        condition &= Q(priority__in=_parse_choice_list(
+            params["priority"], Task.PRIORITY_CHOICES, "priority"))
+    if params.get("assignee"):
+        try:
+            condition &= Q(assigned_to_id=int(params["assignee"]))
+        except ValueError:
+            raise ApiError("Invalid assignee: expected a user id")
+    if params.get("due_after"):
+        condition &= Q(due_date__gte=_parse_due_bound(
+            params["due_after"], "due_after"))
+    if params.get("due_before"):
+        condition &= Q(due_date__lt=_parse_due_bound(
+            params["due_before"], "due_before", end_of_day=True))
+
+    return condition
@@ -0,0 +1,89 @@
+from django.db.models import Exists, OuterRef, Q
+
+from .api import COMMENT_FIELDS, select_fields, serialize
+from .models import Task, TaskComment
+from .pagination import _row_key, decode_cursor, encode_cursor
+
+MAX_CHANGED_COMMENTS = 100
+
+STATUS_LABELS = dict(Task.STATUS_CHOICES)
+
+
+def changes_cursor(updated_at, newest_comment=None):
+    """
+    Cursor meaning "seen everything so far" for a task last updated at
+    ``updated_at`` whose newest comment is ``newest_comment`` (a model
+    instance or ``values()`` dict, or ``None``).
+    """
+    if newest_comment is not None:
+        created_at, pk = _row_key(newest_comment)
+        if created_at >= updated_at:
+            return encode_cursor(created_at, pk)
+    return encode_cursor(updated_at, 0)
+
+
+def _after(created_at, pk):
+    return Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+
+
+def task_changes(queryset, task_id, since):
+    """
+    Comments and task updates on ``task_id`` after the ``since`` cursor.
+
+    One query reads the task's state together with an ``EXISTS`` probe on
+    the ``(task, created_at, id)`` comment index; when neither the task nor
+    its comments moved, that is all that runs and ``None`` is returned.
+    Otherwise returns the payload for the polling endpoint, with at most
+    ``MAX_CHANGED_COMMENTS`` comments oldest first and a ``cursor`` to send
+    next time.
+
+    Raises ``Task.DoesNotExist`` when the task is not in ``queryset`` and
+    ``InvalidCursor`` for a malformed ``since``.
+    """
+    since_at, since_pk = decode_cursor(since)
+
+    newer = TaskComment.objects.filter(_after(since_at, since_pk), task=OuterRef("pk"))
+    task = (
+        queryset.filter(pk=task_id)
+        .annotate(has_new_comments=Exists(newer))
+        .values("status", "updated_at", "comment_count", "has_new_comments")
+        .first()
+    )
+    if task is None:
+        raise Task.DoesNotExist
+    task_changed = task["updated_at"] > since_at
+    if not (task_changed or task["has_new_comments"]):
+        return None
+
+    names = list(COMMENT_FIELDS)
+    comments = []
+    if task["has_new_comments"]:
+        comments = list(
+            select_fields(
+                TaskComment.objects.filter(_after(since_at, since_pk), task_id=task_id),
+                names,
+                COMMENT_FIELDS,
+            ).order_by("created_at", "pk")[: MAX_CHANGED_COMMENTS + 1]
+        )
+    has_more = len(comments) > MAX_CHANGED_COMMENTS
+    comments = comments[:MAX_CHANGED_COMMENTS]
+
+    if has_more:
+        # Jumping to updated_at here would skip the comments not sent yet.
+        cursor = encode_cursor(*_row_key(comments[-1]))
+    else:
+        cursor = changes_cursor(
+            max(task["updated_at"], since_at), comments[-1] if comments else None)
+
+    return {
+        "task": {
+            "status": task["status"],
+            "status_display": STATUS_LABELS.get(task["status"], task["status"]),
+            "updated_at": task["updated_at"],
+            "comment_count": task["comment_count"],
+        },
+        "task_changed": task_changed,
+        "comments": [serialize(row, names, COMMENT_FIELDS) for row in comments],
+        "cursor": cursor,
+        "has_more": has_more,
+    }
@@ -0,0 +1,87 @@
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.db.models import Max
+
+from apps.accounts.roles import get_role
+
+from .stats import aggregate_task_counts
+
+FINGERPRINT_ATTR = "_task_fingerprint"
+
+
+def has_pending_messages(request):
+    """True if the next render would show flash messages."""
+    storage = get_messages(request)
+    pending = bool(list(storage))
+    # Peeking marks the messages as used; keep them for the real render.
+    storage.used = False
+    return pending
+
+
+def make_etag(request, *parts):
+    """
+    Hash ``parts`` together with everything about the viewer that changes
+    the rendered page: the user, their role and the CSRF cookie the
+    template embeds in its forms.
+
+    Returns ``None`` before the client holds a CSRF cookie, because the
+    render is about to mint one and no earlier copy can match it.
+    """
+    csrf_secret = request.META.get("CSRF_COOKIE")
+    if not csrf_secret:
+        return None
+    viewer = (
+        request.user.pk,
+        get_role(request.user),
+        csrf_secret,
+        request.get_full_path(),
+    )
+    raw = "|".join(str(part) for part in viewer + parts)
+    return hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _memoized(request, key, compute):
+    cache = request.__dict__.setdefault(FINGERPRINT_ATTR, {})
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
+
+
+def task_fingerprint(request, queryset, task_id):
+    """
+    ``updated_at``, due date and comment activity for one task, read in a
+    single query and memoized on the request so the ETag and Last-Modified
+    callbacks share it. ``None`` when the task does not exist.
+    """
+    def compute():
+        return (
+            queryset.filter(pk=task_id)
+            .annotate(last_comment=Max("comments__created_at"))
+            .values("updated_at", "due_date", "last_comment", "comment_count")
+            .first()
+        )
+
+    return _memoized(request, ("task", task_id), compute)
+
+
+def task_list_fingerprint(request, queryset):
+    """
+    ``aggregate_task_counts`` for ``queryset`` plus the newest
+    ``updated_at``, memoized on the request. The view reuses the same
+    counts, so the fingerprint costs no extra query on a full render. The
+    total catches deletions and the overdue count catches tasks that went
+    past due without being touched.
+    """
+    return _memoized(
+        request,
+        "list",
+        lambda: aggregate_task_counts(queryset, latest=Max("updated_at")),
+    )
+
+
+def task_last_modified(fingerprint):
+    if fingerprint is None:
+        return None
+    stamps = [fingerprint["updated_at"], fingerprint["last_comment"]]
+    return max(stamp for stamp in stamps if stamp is not None)
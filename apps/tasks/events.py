@@ -0,0 +1,90 @@
+import asyncio
+import json
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.core.pubsub import get_hub, publish
+
+logger = logging.getLogger(__name__)
+
+ALL_TASKS_CHANNEL = "tasks"
+RECONNECT_DELAY_MS = 5000
+
+
+def task_channels(task):
+    """The task's own channel, its assignee's and creator's, and the firehose."""
+    return list(
+        dict.fromkeys(
+            [
+                f"task:{task.pk}",
+                f"user:{task.assigned_to_id}",
+                f"user:{task.created_by_id}",
+                ALL_TASKS_CHANNEL,
+            ]
+        )
+    )
+
+
+def _send(channels, message):
+    try:
+        for channel in channels:
+            publish(channel, message)
+    except Exception:
+        # A broker outage must not turn a committed write into an error.
+        logger.exception("Could not publish %s event", message["type"])
+
+
+def _send_on_commit(channels, message):
+    transaction.on_commit(lambda: _send(channels, message))
+
+
+def announce_status_change(task, old_status):
+    _send_on_commit(
+        task_channels(task),
+        {
+            "type": "status",
+            "task_id": task.pk,
+            "status": task.status,
+            "old_status": old_status,
+        },
+    )
+
+
+def announce_comment(comment):
+    _send_on_commit(
+        task_channels(comment.task),
+        {
+            "type": "comment",
+            "task_id": comment.task_id,
+            "comment_id": comment.pk,
+            "user": comment.user.username,
+        },
+    )
+
+
+def format_event(message):
+    return f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+async def event_stream(channels):
+    """
+    Server-Sent Events for ``channels``: a reconnect hint, then one event
+    per message, with a comment line every ``EVENTS_HEARTBEAT`` seconds to
+    keep proxies from closing an idle stream. Ends after
+    ``EVENTS_MAX_DURATION`` seconds; the browser reconnects on its own.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.EVENTS_MAX_DURATION
+
+    async with get_hub().subscribe(channels) as subscription:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            item = await subscription.get(
+                timeout=min(settings.EVENTS_HEARTBEAT, remaining))
+            if item is None:
+                yield ": keepalive\n\n"
+                continue
+            _, message = item
+            yield format_event(message)
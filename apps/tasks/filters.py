@@ -0,0 +1,69 @@
+from django.db.models import Q
+from django.utils import timezone
+
+from .forms import TaskFilterForm
+from .models import Task
+from .stats import local_day_bounds
+
+
+def plan_task_filters(cleaned_data):
+    """
+    Translate validated filter values into a single ``Q`` object.
+
+    Returns ``None`` when the combination can never match a row, so callers
+    can answer with an empty result without running the query.
+    """
+    condition = Q()
+
+    status = cleaned_data.get("status")
+    if status:
+        condition &= Q(status=status)
+
+    priority = cleaned_data.get("priority")
+    if priority:
+        condition &= Q(priority=priority)
+
+    assigned_to = cleaned_data.get("assigned_to")
+    if assigned_to is not None:
+        condition &= Q(assigned_to_id=assigned_to.pk)
+
+    overdue = cleaned_data.get("overdue")
+    if overdue:
+        # Only open tasks can be overdue.
+        if status and status not in Task.OPEN_STATUSES:
+            return None
+        condition &= Q(due_date__lt=timezone.now(), status__in=Task.OPEN_STATUSES)
+
+    due_date = cleaned_data.get("due_date")
+    if due_date:
+        if overdue and due_date > timezone.localdate():
+            return None
+        start, end = local_day_bounds(due_date)
+        condition &= Q(due_date__gte=start, due_date__lt=end)
+
+    search = (cleaned_data.get("search") or "").strip()
+    if search:
+        condition &= Q(title__icontains=search) | Q(
+            description__icontains=search)
+
+    return condition
+
+
+def filter_tasks(queryset, data, user=None):
+    """
+    Validate ``data`` through ``TaskFilterForm`` and narrow ``queryset``.
+
+    Returns ``(form, queryset)``. Invalid or contradictory filters yield
+    ``queryset.none()``, which Django resolves without a database hit.
+    """
+    if not data:
+        return TaskFilterForm(), queryset
+
+    form = TaskFilterForm(data, user=user)
+    if not form.is_valid():
+        return form, queryset.none()
+
+    condition = plan_task_filters(form.cleaned_data)
+    if condition is None:
+        return form, queryset.none()
+    return form, queryset.filter(condition)
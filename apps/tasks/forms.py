@@ -5,7 +5,10 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
+from apps.accounts.roles import is_manager
+
 from .models import Task, TaskComment
+from .transitions import can_transition
 
 User = get_user_model()
 
@@ -207,6 +210,107 @@ class TaskCreationForm(forms.ModelForm):
         return cleaned_data
 
 
+class TaskImportForm(TaskCreationForm):
+    """
+    ``TaskCreationForm`` rules for one imported row.
+
+    The assignee is given by username and resolved through ``user_lookup``
+    (a ``username -> pk`` callable) so a large import does not run a user
+    query per row. ``cleaned_data["assignee"]`` is the user's pk; a missing
+    priority falls back to the model default.
+    """
+
+    assignee = forms.CharField(max_length=150)
+
+    class Meta(TaskCreationForm.Meta):
+        fields = [
+            "title",
+            "description",
+            "priority",
+            "due_date",
+            "status",
+            "estimated_hours",
+            "notes",
+        ]
+
+    def __init__(self, *args, **kwargs):
+        self.user_lookup = kwargs.pop("user_lookup")
+        super().__init__(*args, **kwargs)
+        self.fields["priority"].required = False
+
+    def clean_priority(self):
+        return (
+            self.cleaned_data.get("priority")
+            or Task._meta.get_field("priority").default
+        )
+
+    def clean_assignee(self):
+        username = self.cleaned_data["assignee"].strip()
+        user_id = self.user_lookup(username)
+        if user_id is None:
+            raise ValidationError(f"Unknown user '{username}'.")
+        return user_id
+
+    def build_task(self, created_by):
+        task = self.instance
+        task.assigned_to_id = self.cleaned_data["assignee"]
+        task.created_by = created_by
+        task.status = self.cleaned_data.get("status") or "pending"
+        return task
+
+
+class TaskApiForm(TaskCreationForm):
+    """
+    ``TaskCreationForm`` rules for the JSON API.
+
+    The assignee comes in as ``assignee_id`` and is required. Pass
+    ``partial`` (the keys a PATCH sent) to bind and validate only those
+    fields, so untouched values such as a past due date are not re-checked
+    against the creation rules.
+    """
+
+    assignee_id = forms.ModelChoiceField(queryset=User.objects.all())
+
+    class Meta(TaskCreationForm.Meta):
+        fields = [
+            "title",
+            "description",
+            "priority",
+            "due_date",
+            "status",
+            "estimated_hours",
+            "notes",
+        ]
+
+    def __init__(self, *args, partial=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        del self.fields["assignee"]
+        if partial is not None:
+            for name in set(self.fields) - set(partial):
+                del self.fields[name]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        # The base rule only sees a due date sent with this request.
+        if (
+            cleaned_data.get("priority") == "urgent"
+            and "due_date" not in self.fields
+            and self.instance.due_date > timezone.now() + timedelta(days=3)
+        ):
+            raise ValidationError(
+                "Urgent priority tasks should have a due date within 3 days."
+            )
+        return cleaned_data
+
+    def save(self, commit=True):
+        task = super().save(commit=False)
+        if self.cleaned_data.get("assignee_id") is not None:
+            task.assigned_to = self.cleaned_data["assignee_id"]
+        if commit:
+            task.save()
+        return task
+
+
 class TaskUpdateForm(forms.ModelForm):
     class Meta:
         model = Task
@@ -228,21 +332,14 @@ class TaskUpdateForm(forms.ModelForm):
         new_status = self.cleaned_data.get("status")
         current_status = self.instance.status if self.instance else "pending"
 
-        valid_transitions = {
-            "pending": ["in_progress", "cancelled"],
-            "in_progress": ["completed", "pending", "cancelled"],
-            "completed": [],
-            "cancelled": ["pending"],
-        }
-
-        if new_status not in valid_transitions.get(current_status, []):
+        if not can_transition(current_status, new_status):
             raise ValidationError(
                 f"Cannot change status from {current_status} to {new_status}."
             )
 
         if (
             self.user
-            and not self.user.groups.filter(name="Managers").exists()
+            and not is_manager(self.user)
             and current_status == "in_progress"
             and new_status == "pending"
         ):
@@ -317,12 +414,19 @@ class TaskFilterForm(forms.Form):
         widget=forms.Select(attrs={"class": "form-select"}),
     )
 
+    due_date = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}),
+    )
+
+    overdue = forms.BooleanField(required=False)
+
     def __init__(self, *args, **kwargs):
         user = kwargs.pop("user", None)
         super().__init__(*args, **kwargs)
 
         if user:
-            if user.groups.filter(name="Managers").exists():
+            if is_manager(user):
                 employees = User.objects.filter(groups__name="Employees")
                 if employees.exists():
                     self.fields["assigned_to"].queryset = employees
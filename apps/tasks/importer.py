@@ -0,0 +1,146 @@
+import csv
+import json
+import os
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from .forms import TaskImportForm
+from .models import Task, UserTaskCounters
+from .signals import tasks_bulk_created
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+IMPORT_BATCH_SIZE = 500
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def detect_format(filename, default=None):
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if ext == "ndjson":
+        ext = "jsonl"
+    if ext in IMPORT_FORMATS:
+        return ext
+    if default:
+        return default
+    raise ImportFormatError(
+        f"Cannot tell the format of '{filename}'; use one of "
+        f"{', '.join(IMPORT_FORMATS)}."
+    )
+
+
+def iter_rows(stream, fmt):
+    """
+    Yield ``(line_number, row, error)`` for each record in a text stream.
+
+    ``row`` is a dict of raw field values, or ``None`` when the line could
+    not be parsed, in which case ``error`` says why. Only the current line is
+    held in memory.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, None, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, "Expected a JSON object."
+                continue
+            yield line_number, row, None
+    else:
+        raise ImportFormatError(f"Unsupported format '{fmt}'.")
+
+
+class UserLookup:
+    """Resolve usernames to pks, querying each distinct username once."""
+
+    def __init__(self):
+        self._ids = {}
+        self._users = get_user_model().objects
+
+    def __call__(self, username):
+        if username not in self._ids:
+            self._ids[username] = (
+                self._users.filter(username=username)
+                .values_list("pk", flat=True)
+                .first()
+            )
+        return self._ids[username]
+
+
+def import_tasks(rows, created_by, batch_size=IMPORT_BATCH_SIZE, on_error=None):
+    """
+    Validate ``rows`` from ``iter_rows`` with ``TaskImportForm`` and insert
+    the valid ones with ``bulk_create`` every ``batch_size`` rows.
+
+    Each rejected line is passed to ``on_error(line_number, errors)`` as soon
+    as it is seen instead of being collected, so memory stays bounded by the
+    batch size. Returns ``{"created": n, "failed": n}``.
+
+    Batches commit as they fill, so a file that stops decoding part way
+    through is imported up to the last readable line; the summary then
+    also carries ``"stopped_after_line"`` and the ``"read_error"``.
+    """
+    user_lookup = UserLookup()
+    summary = {"created": 0, "failed": 0}
+    batch = []
+    last_line = 0
+
+    def reject(line_number, errors):
+        summary["failed"] += 1
+        if on_error is not None:
+            on_error(line_number, errors)
+
+    def flush():
+        with transaction.atomic():
+            Task.objects.bulk_create(batch)
+            UserTaskCounters.apply_deltas(
+                Counter((task.assigned_to_id, task.status) for task in batch))
+            tasks_bulk_created.send(sender=Task, tasks=batch)
+        summary["created"] += len(batch)
+        batch.clear()
+
+    def handle(line_number, row, error):
+        if error is not None:
+            reject(line_number, {"__all__": [error]})
+            return
+
+        data = {
+            key: value
+            for key, value in row.items()
+            if key and value not in ("", None)
+        }
+        form = TaskImportForm(data, user=created_by, user_lookup=user_lookup)
+        if not form.is_valid():
+            reject(
+                line_number,
+                {field: list(errors) for field, errors in form.errors.items()},
+            )
+            return
+
+        batch.append(form.build_task(created_by))
+        if len(batch) >= batch_size:
+            flush()
+
+    try:
+        for line_number, row, error in rows:
+            last_line = line_number
+            handle(line_number, row, error)
+    except (UnicodeDecodeError, csv.Error) as exc:
+        summary["stopped_after_line"] = last_line
+        summary["read_error"] = str(exc)
+
+    if batch:
+        flush()
+    return summary
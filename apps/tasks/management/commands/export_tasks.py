@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.exporter import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    export_rows,
+    render_export,
+)
+from apps.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = "Stream every task to CSV or JSON without loading them all at once."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="File to write to (defaults to standard output).",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[status for status, _ in Task.STATUS_CHOICES],
+            help="Only export tasks with this status.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        qs = Task.objects.all()
+        if options["status"]:
+            qs = qs.filter(status=options["status"])
+
+        chunks = render_export(
+            export_rows(qs, chunk_size=options["chunk_size"]), options["format"]
+        )
+
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        try:
+            with open(options["output"], "w", newline="", encoding="utf-8") as fh:
+                fh.writelines(chunks)
+        except OSError as exc:
+            raise CommandError(str(exc))
+        self.stderr.write(f"Exported tasks to {options['output']}.")
@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.importer import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    ImportFormatError,
+    detect_format,
+    import_tasks,
+    iter_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Import tasks from a CSV or JSONL file, validating every row."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSONL file to import.")
+        parser.add_argument(
+            "--created-by",
+            required=True,
+            help="Username recorded as the creator of the imported tasks.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="File format (defaults to the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            creator = User.objects.get(username=options["created_by"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named '{options['created_by']}'.")
+
+        try:
+            fmt = options["format"] or detect_format(options["path"])
+        except ImportFormatError as exc:
+            raise CommandError(str(exc))
+
+        def report(line_number, errors):
+            for field, messages in errors.items():
+                for message in messages:
+                    self.stderr.write(f"line {line_number}: {field}: {message}")
+
+        try:
+            with open(options["path"], newline="", encoding="utf-8-sig") as fh:
+                summary = import_tasks(
+                    iter_rows(fh, fmt),
+                    creator,
+                    batch_size=options["batch_size"],
+                    on_error=report,
+                )
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        if "read_error" in summary:
+            raise CommandError(
+                f"Could not read file after line {summary['stopped_after_line']}: "
+                f"{summary['read_error']}. Imported {summary['created']} task(s), "
+                f"{summary['failed']} line(s) rejected before that."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {summary['created']} task(s), "
+                f"{summary['failed']} line(s) rejected."
+            )
+        )
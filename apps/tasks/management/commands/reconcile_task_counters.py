@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from apps.tasks.models import UserTaskCounters
+
+
+class Command(BaseCommand):
+    help = "Recount per-user task counters from the tasks table and fix drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only reconcile this user id (may be repeated).",
+        )
+
+    def handle(self, *args, user_ids=None, **options):
+        fixed = UserTaskCounters.reconcile(user_ids)
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled task counters: {fixed} row(s) updated.")
+        )
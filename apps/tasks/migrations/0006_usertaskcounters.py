@@ -0,0 +1,68 @@
+# Generated by Django 5.2.5 on 2026-10-17 03:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+STATUSES = ("pending", "in_progress", "completed", "cancelled")
+
+
+def backfill_counters(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Task = apps.get_model("tasks", "Task")
+    UserTaskCounters = apps.get_model("tasks", "UserTaskCounters")
+
+    counts = {
+        row.pop("assigned_to_id"): row
+        for row in Task.objects.order_by()
+        .values("assigned_to_id")
+        .annotate(
+            total=Count("pk"),
+            **{s: Count("pk", filter=Q(status=s)) for s in STATUSES},
+        )
+    }
+    UserTaskCounters.objects.bulk_create(
+        [
+            UserTaskCounters(user_id=pk, **counts.get(pk, {}))
+            for pk in User.objects.values_list("pk", flat=True).iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_task_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserTaskCounters",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="task_counters",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total", models.IntegerField(default=0)),
+                ("pending", models.IntegerField(default=0)),
+                ("in_progress", models.IntegerField(default=0)),
+                ("completed", models.IntegerField(default=0)),
+                ("cancelled", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "User Task Counters",
+                "verbose_name_plural": "User Task Counters",
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
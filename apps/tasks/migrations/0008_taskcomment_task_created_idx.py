@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-17 04:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_task_comment_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="taskcomment",
+            index=models.Index(
+                fields=["task", "created_at", "id"],
+                name="comment_task_created_idx",
+            ),
+        ),
+    ]
@@ -1,9 +1,18 @@
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.core.validators import MinLengthValidator
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
+from apps.core.cache import tasks_cache
+
+from .events import announce_comment, announce_status_change
+from .signals import statuses_changed, tasks_bulk_created
+
 User = get_user_model()
 
 
@@ -14,6 +23,8 @@ class Task(models.Model):
         ("completed", "Completed"),
         ("cancelled", "Cancelled"),
     ]
+    # Statuses that can still go overdue.
+    OPEN_STATUSES = ["pending", "in_progress"]
 
     PRIORITY_CHOICES = [
         ("low", "Low"),
@@ -66,10 +77,29 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    # Maintained by the TaskComment receivers below with F() updates, so
+    # Task.save() never writes it back from a possibly stale instance.
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(
+                fields=["assigned_to", "status"],
+                name="task_assignee_status_idx",
+            ),
+            models.Index(
+                fields=["status", "due_date"],
+                name="task_status_due_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="task_created_idx",
+            ),
+            models.Index(fields=["updated_at"], name="task_updated_idx"),
+        ]
 
     def __init__(self, *args, **kwargs):
         assignee = kwargs.pop("assignee", None)
@@ -77,6 +107,16 @@ class Task(models.Model):
         if assignee is not None:
             self.assigned_to = assignee
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_loaded_value(self, attname):
+        """Value of ``attname`` as last read from or written to the DB."""
+        return getattr(self, "_loaded_values", {}).get(attname)
+
     @property
     def assignee(self):
         return self.assigned_to
@@ -117,11 +157,36 @@ class Task(models.Model):
         if self.status != "completed" and self.completed_at:
             self.completed_at = None
 
-        super().save(*args, **kwargs)
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        if not (adding or kwargs.get("force_insert")) and update_fields is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != "comment_count"
+            ]
+        elif update_fields is not None and "status" in update_fields:
+            # completed_at follows status, and the ETags and change feed
+            # key on updated_at, so a status-only save must write both.
+            kwargs["update_fields"] = [
+                *update_fields,
+                *({"completed_at", "updated_at"} - set(update_fields)),
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            UserTaskCounters.record_save(
+                self, adding, kwargs.get("update_fields"))
+        self._loaded_values = {
+            "status": self.status,
+            "assigned_to_id": self.assigned_to_id,
+        }
 
     @property
     def is_overdue(self):
-        if self.status == "completed":
+        if self.status not in self.OPEN_STATUSES:
             return False
         return timezone.now() > self.due_date
 
@@ -172,6 +237,236 @@ class TaskComment(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Serves the thread pages and the changes-since-cursor probe.
+            models.Index(
+                fields=["task", "created_at", "id"],
+                name="comment_task_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.task.title}"
+
+
+class UserTaskCounters(models.Model):
+    """
+    Per-assignee task totals by status, kept in step with every Task write.
+
+    ``Task.save`` adjusts the affected rows inside the same transaction and
+    deletes are handled by the ``post_delete`` receiver below. Bulk writes
+    that skip ``save()`` should pass what they changed to ``apply_deltas()``
+    (or call ``reconcile()`` when they cannot tell); the
+    ``reconcile_task_counters`` command repairs any drift.
+    """
+
+    STATUS_FIELDS = [status for status, _ in Task.STATUS_CHOICES]
+    COUNTER_FIELDS = ["total"] + STATUS_FIELDS
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_counters",
+    )
+    total = models.IntegerField(default=0)
+    pending = models.IntegerField(default=0)
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Task Counters"
+        verbose_name_plural = "User Task Counters"
+
+    def __str__(self):
+        return f"{self.user_id}: {self.total} tasks, {self.completed} completed"
+
+    def as_counts(self):
+        """Same shape as ``aggregate_task_counts`` minus overdue/priority."""
+        return {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+
+    @classmethod
+    def for_user(cls, user):
+        counters = cls.objects.filter(user_id=user.pk).first()
+        if counters is None:
+            cls.reconcile([user.pk])
+            counters = cls.objects.get(user_id=user.pk)
+        return counters
+
+    @classmethod
+    def shift(cls, user_id, status, delta, repair=True):
+        if not user_id or status not in cls.STATUS_FIELDS:
+            return
+        updated = cls.objects.filter(user_id=user_id).update(
+            total=F("total") + delta,
+            **{status: F(status) + delta},
+        )
+        if not updated and repair:
+            cls.reconcile([user_id])
+
+    @classmethod
+    def apply_deltas(cls, deltas):
+        """
+        Apply ``{(user_id, status): delta}`` with one UPDATE per user, so a
+        bulk write costs the same however many tasks those users already
+        have. Users without a counters row are reconciled instead.
+        """
+        per_user = defaultdict(Counter)
+        for (user_id, status), delta in deltas.items():
+            if user_id and status in cls.STATUS_FIELDS and delta:
+                per_user[user_id][status] += delta
+
+        missing = []
+        for user_id, statuses in per_user.items():
+            updated = cls.objects.filter(user_id=user_id).update(
+                total=F("total") + sum(statuses.values()),
+                **{status: F(status) + delta for status, delta in statuses.items()},
+            )
+            if not updated:
+                missing.append(user_id)
+        if missing:
+            cls.reconcile(missing)
+
+    @classmethod
+    def record_save(cls, task, created, update_fields=None):
+        if created:
+            cls.shift(task.assigned_to_id, task.status, 1)
+            return
+
+        written = None if update_fields is None else set(update_fields)
+        old_user = task.get_loaded_value("assigned_to_id")
+        old_status = task.get_loaded_value("status")
+        new_user = task.assigned_to_id
+        new_status = task.status
+        if written is not None:
+            if not written & {"assigned_to", "assigned_to_id"}:
+                new_user = old_user
+            if "status" not in written:
+                new_status = old_status
+
+        if old_user is None or old_status is None:
+            cls.reconcile({u for u in (old_user, new_user) if u})
+            return
+        if (old_user, old_status) == (new_user, new_status):
+            return
+
+        cls.shift(old_user, old_status, -1)
+        cls.shift(new_user, new_status, 1)
+
+    @classmethod
+    def reconcile(cls, user_ids=None):
+        """
+        Recount tasks for ``user_ids`` (every user when None) in one grouped
+        query and rewrite rows that disagree. Returns the number of rows
+        created or corrected.
+        """
+        users = User.objects.all()
+        tasks = Task.objects.all()
+        existing = cls.objects.all()
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            users = users.filter(pk__in=user_ids)
+            tasks = tasks.filter(assigned_to_id__in=user_ids)
+            existing = existing.filter(user_id__in=user_ids)
+
+        zero = dict.fromkeys(cls.COUNTER_FIELDS, 0)
+        expected = {pk: dict(zero) for pk in users.values_list("pk", flat=True)}
+        rows = (
+            tasks.order_by()
+            .values("assigned_to_id")
+            .annotate(
+                total=Count("pk"),
+                **{
+                    status: Count("pk", filter=Q(status=status))
+                    for status in cls.STATUS_FIELDS
+                },
+            )
+        )
+        for row in rows:
+            user_id = row.pop("assigned_to_id")
+            if user_id in expected:
+                expected[user_id] = row
+
+        now = timezone.now()
+        stale = []
+        for counters in existing:
+            counts = expected.pop(counters.user_id, None)
+            if counts is None or counters.as_counts() == counts:
+                continue
+            for field, value in counts.items():
+                setattr(counters, field, value)
+            counters.updated_at = now
+            stale.append(counters)
+        missing = [
+            cls(user_id=user_id, **counts) for user_id, counts in expected.items()
+        ]
+
+        with transaction.atomic():
+            if stale:
+                cls.objects.bulk_update(
+                    stale, cls.COUNTER_FIELDS + ["updated_at"])
+            if missing:
+                cls.objects.bulk_create(missing, ignore_conflicts=True)
+        return len(stale) + len(missing)
+
+
+@receiver(post_delete, sender=Task)
+def uncount_deleted_task(sender, instance, **kwargs):
+    # No repair here: during a user cascade the counters row may already be
+    # gone, and recreating it would point at a user about to be deleted.
+    UserTaskCounters.shift(
+        instance.assigned_to_id,
+        instance.get_loaded_value("status") or instance.status,
+        -1,
+        repair=False,
+    )
+
+
+@receiver(post_save, sender=TaskComment)
+def count_new_comment(sender, instance, created, **kwargs):
+    if created:
+        Task.objects.filter(pk=instance.task_id).update(
+            comment_count=F("comment_count") + 1)
+        announce_comment(instance)
+
+
+@receiver(post_save, sender=Task)
+def announce_saved_status(sender, instance, created, update_fields=None,
+                          **kwargs):
+    if update_fields is not None and "status" not in update_fields:
+        return
+    # Task.save() refreshes the loaded values only after post_save.
+    old_status = None if created else instance.get_loaded_value("status")
+    if created or old_status != instance.status:
+        announce_status_change(instance, old_status)
+
+
+@receiver(statuses_changed, sender=Task)
+def announce_bulk_statuses(sender, changes, **kwargs):
+    for task, old_status in changes:
+        announce_status_change(task, old_status)
+
+
+@receiver(post_delete, sender=TaskComment)
+def uncount_deleted_comment(sender, instance, origin=None, **kwargs):
+    # Comments deleted along with their task need no bookkeeping.
+    if isinstance(origin, Task) or getattr(origin, "model", None) is Task:
+        return
+    Task.objects.filter(pk=instance.task_id, comment_count__gt=0).update(
+        comment_count=F("comment_count") - 1)
+
+
+# Cache group for task aggregates (see stats.py). Any task write drops the
+# whole group; the short timeout covers changes that never touch a task,
+# such as someone joining the Employees group.
+STATS_CACHE_GROUP = "stats"
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(statuses_changed, sender=Task)
+@receiver(tasks_bulk_created, sender=Task)
+def invalidate_task_stats(sender, **kwargs):
+    tasks_cache.invalidate_group(STATS_CACHE_GROUP)
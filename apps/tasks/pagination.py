@@ -0,0 +1,123 @@
+import base64
+from datetime import datetime, timezone as dt_timezone
+
+from django.db.models import Q
+from django.utils import timezone
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        stamp, pk = raw.rsplit("|", 1)
+        created_at = datetime.fromisoformat(stamp)
+        pk = int(pk)
+    except (ValueError, UnicodeError):
+        raise InvalidCursor("Malformed pagination cursor")
+
+    if timezone.is_naive(created_at):
+        created_at = timezone.make_aware(created_at, dt_timezone.utc)
+    return created_at, pk
+
+
+def clamp_page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def _row_key(row):
+    # values() querysets yield dicts; they must include created_at and id.
+    if isinstance(row, dict):
+        return row["created_at"], row["id"]
+    return row.created_at, row.pk
+
+
+class KeysetPage:
+    """
+    One page of a queryset walked in ``(-created_at, -pk)`` order.
+
+    Cursors are opaque tokens pointing at the first/last row of the page, so
+    fetching page N costs the same index range scan as fetching page 1.
+    Rows may be model instances or ``values()`` dicts.
+    """
+
+    def __init__(self, object_list, page_size, has_next, has_previous):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.has_next = has_next and bool(object_list)
+        self.has_previous = has_previous and bool(object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    @property
+    def next_cursor(self):
+        if not self.has_next:
+            return None
+        return encode_cursor(*_row_key(self.object_list[-1]))
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous:
+            return None
+        return encode_cursor(*_row_key(self.object_list[0]))
+
+
+def paginate_queryset(queryset, after=None, before=None, page_size=None):
+    """
+    Return a ``KeysetPage`` of ``queryset`` newest first.
+
+    ``after`` continues towards older rows, ``before`` walks back towards
+    newer ones. Raises ``InvalidCursor`` for tokens that do not decode.
+    """
+    page_size = clamp_page_size(page_size)
+
+    if before:
+        created_at, pk = decode_cursor(before)
+        rows = list(
+            queryset.filter(
+                Q(created_at__gt=created_at)
+                | Q(created_at=created_at, pk__gt=pk)
+            ).order_by("created_at", "pk")[: page_size + 1]
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        rows.reverse()
+        return KeysetPage(rows, page_size, has_next=True, has_previous=has_more)
+
+    qs = queryset.order_by("-created_at", "-pk")
+    if after:
+        created_at, pk = decode_cursor(after)
+        qs = qs.filter(
+            Q(created_at__lt=created_at)
+            | Q(created_at=created_at, pk__lt=pk)
+        )
+    rows = list(qs[: page_size + 1])
+    has_more = len(rows) > page_size
+    return KeysetPage(
+        rows[:page_size],
+        page_size,
+        has_next=has_more,
+        has_previous=bool(after),
+    )
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Sent after a bulk write changed task statuses without going through
+# Task.save(). ``changes`` is a list of ``(task, old_status)`` pairs where
+# ``task`` already carries the new status.
+statuses_changed = Signal()
+
+# Sent after tasks were inserted with bulk_create. ``tasks`` is the list of
+# new Task instances.
+tasks_bulk_created = Signal()
@@ -0,0 +1,186 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Case, Count, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast, TruncDate
+from django.utils import timezone
+
+from apps.core.cache import tasks_cache
+
+from .models import STATS_CACHE_GROUP, Task
+
+User = get_user_model()
+
+PROGRESS_WINDOWS = (7, 30, 90)
+
+
+def local_day_bounds(day):
+    """Aware ``[start, end)`` datetimes covering ``day`` in the current tz."""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(day, time.min), tz)
+    return start, start + timedelta(days=1)
+
+
+def aggregate_task_counts(queryset, now=None, **extra):
+    """
+    Count ``queryset`` by status, overdue and priority in one query.
+
+    Returns a dict with ``total``, one key per status, ``overdue`` and a
+    ``priority`` dict keyed by priority value. Overdue means past due and
+    still in one of ``Task.OPEN_STATUSES``. Any ``extra``
+    aggregates ride along in the same query and come back under their own
+    keys.
+    """
+    now = now or timezone.now()
+
+    aggregates = {"total": Count("pk")}
+    for status, _ in Task.STATUS_CHOICES:
+        aggregates[status] = Count("pk", filter=Q(status=status))
+    aggregates["overdue"] = Count(
+        "pk", filter=Q(due_date__lt=now, status__in=Task.OPEN_STATUSES))
+    for priority, _ in Task.PRIORITY_CHOICES:
+        aggregates[f"priority_{priority}"] = Count(
+            "pk", filter=Q(priority=priority))
+
+    row = queryset.order_by().aggregate(**aggregates, **extra)
+
+    counts = {
+        key: row[key] or 0
+        for key in ["total", "overdue"] + [s for s, _ in Task.STATUS_CHOICES]
+    }
+    counts["priority"] = {
+        p: row[f"priority_{p}"] or 0 for p, _ in Task.PRIORITY_CHOICES
+    }
+    counts.update({key: row[key] for key in extra})
+    return counts
+
+
+def completion_percentage(counts, digits=1):
+    if not counts["total"]:
+        return 0
+    return round((counts["completed"] / counts["total"]) * 100, digits)
+
+
+def team_performance(limit=10):
+    """
+    Completion figures for members of the ``Employees`` group.
+
+    Counting, ranking and the ``limit`` cut all run in one grouped query
+    over ``Task.assigned_to``; employees without tasks rank with a 0% rate.
+    """
+    assigned = Count("assigned_tasks")
+    completed = Count(
+        "assigned_tasks", filter=Q(assigned_tasks__status="completed"))
+    rate = Case(
+        When(assigned_count=0, then=Value(0.0)),
+        default=(
+            Cast(F("completed_count"), FloatField())
+            * 100.0 / F("assigned_count")
+        ),
+        output_field=FloatField(),
+    )
+
+    rows = (
+        User.objects.filter(groups__name="Employees")
+        .annotate(assigned_count=assigned, completed_count=completed)
+        .annotate(completion_rate=rate)
+        .order_by("-completion_rate", "pk")
+        .values(
+            "username",
+            "first_name",
+            "last_name",
+            "assigned_count",
+            "completed_count",
+            "completion_rate",
+        )[:limit]
+    )
+
+    return [
+        {
+            "name": (
+                f"{row['first_name']} {row['last_name']}".strip()
+                or row["username"]
+            ),
+            "assigned_count": row["assigned_count"],
+            "completed_count": row["completed_count"],
+            "completion_rate": round(row["completion_rate"] or 0, 1),
+        }
+        for row in rows
+    ]
+
+
+def daily_progress(queryset, days=7, end=None):
+    """
+    Per-day total/completed counts for tasks due in the last ``days`` days.
+
+    One ``TruncDate`` grouped query over a ``due_date`` range; days with no
+    tasks are zero-filled so the result always has ``days`` entries, oldest
+    first. ``days`` must be one of ``PROGRESS_WINDOWS``.
+    """
+    if days not in PROGRESS_WINDOWS:
+        raise ValueError(
+            f"days must be one of {PROGRESS_WINDOWS}, got {days!r}")
+
+    end = end or timezone.localdate()
+    start = end - timedelta(days=days - 1)
+    range_start, _ = local_day_bounds(start)
+    _, range_end = local_day_bounds(end)
+
+    rows = (
+        queryset.filter(due_date__gte=range_start, due_date__lt=range_end)
+        .annotate(
+            day=TruncDate("due_date", tzinfo=timezone.get_current_timezone()))
+        .values("day")
+        .annotate(
+            total=Count("pk"),
+            completed=Count("pk", filter=Q(status="completed")),
+        )
+        .order_by("day")
+    )
+    by_day = {row["day"]: row for row in rows}
+
+    buckets = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        row = by_day.get(day, {"total": 0, "completed": 0})
+        buckets.append(
+            {
+                "day_name": day.strftime("%a"),
+                "date": day,
+                "total": row["total"],
+                "completed": row["completed"],
+                "completion_rate": (
+                    round((row["completed"] / row["total"]) * 100)
+                    if row["total"]
+                    else 0
+                ),
+            }
+        )
+    return buckets
+
+
+def cached_task_counts(scope, queryset):
+    """
+    ``aggregate_task_counts(queryset)`` through the stats cache group.
+
+    ``scope`` names whose view of the tasks ``queryset`` is (``"all"`` or
+    ``"user:<pk>"``); callers must pass the same scope only for the same
+    queryset.
+    """
+    return tasks_cache.get_or_compute(
+        f"task_counts:{scope}",
+        lambda: aggregate_task_counts(queryset),
+        settings.STATS_CACHE_TIMEOUT,
+        group=STATS_CACHE_GROUP,
+    )
+
+
+def cached_team_performance(limit=10):
+    """``team_performance(limit)`` through the stats cache group."""
+    return tasks_cache.get_or_compute(
+        f"team_performance:{limit}",
+        lambda: team_performance(limit=limit),
+        settings.STATS_CACHE_TIMEOUT,
+        group=STATS_CACHE_GROUP,
+    )
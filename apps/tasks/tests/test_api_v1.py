@@ -0,0 +1,177 @@
+import json
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.api import TASK_FIELDS, select_fields, serialize
+from apps.tasks.models import Task, TaskComment
+
+
+class TaskApiV1Tests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.alice = make_user(username="alice", email="alice@example.com")
+        self.bob = make_user(username="bob", email="bob@example.com")
+        now = timezone.now()
+        self.soon = make_task(
+            title="Due soon", assigned_to=self.alice, created_by=self.manager,
+            priority="high", due_date=now + timedelta(days=1))
+        self.later = make_task(
+            title="Due later", assigned_to=self.alice, created_by=self.manager,
+            status="in_progress", due_date=now + timedelta(days=20))
+        self.other = make_task(
+            title="Not Alice's", assigned_to=self.bob, created_by=self.manager,
+            due_date=now + timedelta(days=2))
+        self.list_url = reverse("tasks:api_task_list")
+
+    def _detail(self, task):
+        return reverse("tasks:api_task_detail", kwargs={"task_id": task.pk})
+
+    def _send(self, method, url, payload):
+        return getattr(self.client, method)(
+            url, data=json.dumps(payload), content_type="application/json")
+
+    def test_list_sparse_fields_in_one_query(self):
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.get(self.list_url, {"fields": "title,assignee"})
+        self.assertEqual(r.status_code, 200)
+
+        results = r.json()["results"]
+        self.assertEqual(results[0], {"title": "Not Alice's", "assignee": "bob"})
+        self.assertEqual(len(results), 3)
+
+        with self.assertNumQueries(1):
+            rows = select_fields(Task.objects.all(), ["title"], TASK_FIELDS)
+            [serialize(row, ["title"], TASK_FIELDS) for row in rows]
+
+        r = self.client.get(self.list_url, {"fields": "title,password"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_visibility_filters_and_cursor(self):
+        self.client.login(username="alice", password="pass12345")
+
+        r = self.client.get(self.list_url, {"page_size": 1, "fields": "id"})
+        body = r.json()
+        self.assertEqual(body["results"], [{"id": self.later.pk}])
+        r = self.client.get(
+            self.list_url,
+            {"page_size": 1, "fields": "id", "after": body["next_cursor"]},
+        )
+        self.assertEqual(r.json()["results"], [{"id": self.soon.pk}])
+        self.assertIsNone(r.json()["next_cursor"])
+
+        tomorrow = (timezone.localdate() + timedelta(days=1)).isoformat()
+        for params, expected in (
+            ({"status": "pending,in_progress"}, [self.later, self.soon]),
+            ({"priority": "high"}, [self.soon]),
+            ({"due_before": tomorrow}, [self.soon]),
+            ({"due_after": tomorrow, "due_before": tomorrow}, [self.soon]),
+            ({"assignee": self.bob.pk}, []),
+        ):
+            r = self.client.get(self.list_url, {"fields": "id", **params})
+            self.assertEqual(
+                [row["id"] for row in r.json()["results"]],
+                [t.pk for t in expected],
+                params,
+            )
+
+        self.assertEqual(
+            self.client.get(self.list_url, {"status": "done"}).status_code, 400)
+        self.assertEqual(self.client.get(self._detail(self.other)).status_code, 403)
+        self.assertEqual(
+            self.client.get(reverse(
+                "tasks:api_task_detail", kwargs={"task_id": 999999})).status_code,
+            404,
+        )
+
+    def test_create_update_delete(self):
+        self.client.login(username="mgr", password="pass12345")
+        due = (timezone.now() + timedelta(days=5)).strftime("%Y-%m-%dT%H:%M")
+
+        r = self._send("post", self.list_url, {
+            "title": "Draft the plan",
+            "description": "Outline for next quarter",
+            "assignee_id": self.bob.pk,
+            "priority": "low",
+            "due_date": due,
+        })
+        self.assertEqual(r.status_code, 201, r.content)
+        created = r.json()
+        self.assertEqual(created["assignee"], "bob")
+        self.assertEqual(created["created_by"], "mgr")
+        self.assertEqual(created["status"], "pending")
+
+        r = self._send("post", self.list_url, {"title": "Bad", "description": "x"})
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("title", r.json()["errors"])
+
+        task = Task.objects.get(pk=created["id"])
+        r = self._send("patch", self._detail(task), {"status": "in_progress"})
+        self.assertEqual(r.json()["status"], "in_progress")
+        r = self._send("patch", self._detail(self.soon), {"status": "completed"})
+        self.assertEqual(r.status_code, 400)
+
+        self.assertEqual(self.client.delete(self._detail(task)).status_code, 204)
+        self.assertFalse(Task.objects.filter(pk=task.pk).exists())
+
+    def test_create_requires_an_assignee(self):
+        self.client.login(username="mgr", password="pass12345")
+        due = (timezone.now() + timedelta(days=5)).strftime("%Y-%m-%dT%H:%M")
+
+        r = self._send("post", self.list_url, {
+            "title": "Unassigned work",
+            "description": "Nobody has picked this up",
+            "priority": "low",
+            "due_date": due,
+        })
+
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("assignee_id", r.json()["errors"])
+
+    def test_patch_only_validates_sent_fields(self):
+        self.client.login(username="mgr", password="pass12345")
+        Task.objects.filter(pk=self.soon.pk).update(
+            due_date=timezone.now() - timedelta(days=2))
+
+        r = self._send("patch", self._detail(self.soon), {"status": "in_progress"})
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(r.json()["status"], "in_progress")
+        self.soon.refresh_from_db()
+        self.assertEqual(self.soon.title, "Due soon")
+        self.assertEqual(self.soon.assigned_to, self.alice)
+
+        r = self._send("patch", self._detail(self.soon), {
+            "due_date": (timezone.now() - timedelta(days=1)).strftime(
+                "%Y-%m-%dT%H:%M"),
+        })
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("due_date", r.json()["errors"])
+
+        r = self._send("patch", self._detail(self.later), {"priority": "urgent"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_employee_cannot_create_or_delete(self):
+        self.client.login(username="alice", password="pass12345")
+        self.assertEqual(self._send("post", self.list_url, {}).status_code, 403)
+        self.assertEqual(self.client.delete(self._detail(self.soon)).status_code, 403)
+
+    def test_comments(self):
+        url = reverse("tasks:api_task_comments", kwargs={"task_id": self.soon.pk})
+        self.client.login(username="alice", password="pass12345")
+
+        r = self._send("post", url, {"comment": "Started on this today"})
+        self.assertEqual(r.status_code, 201)
+        self.assertEqual(r.json()["user"], "alice")
+        TaskComment.objects.create(
+            task=self.soon, user=self.manager, comment="Thanks for the update")
+
+        r = self.client.get(url, {"fields": "user,comment"})
+        self.assertEqual(
+            [c["user"] for c in r.json()["results"]], ["mgr", "alice"])
+
+        other = reverse("tasks:api_task_comments", kwargs={"task_id": self.other.pk})
+        self.assertEqual(self.client.get(other).status_code, 403)
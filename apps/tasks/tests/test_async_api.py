@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task, TaskComment
+
+
+class AsyncApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = make_user("async_worker", "async_worker@example.com")
+        self.manager = make_user("async_boss", "async_boss@example.com", is_manager=True)
+        self.outsider = make_user("async_outsider", "async_outsider@example.com")
+        self.task = make_task(assigned_to=self.user, created_by=self.manager)
+
+    async def test_stats_are_scoped_to_the_viewer(self):
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+
+        response = await client.get(reverse("tasks:task_stats_api"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total_tasks"], 1)
+
+    async def test_status_update_commits_the_transition(self):
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+
+        response = await client.post(
+            reverse("tasks:update_status_ajax"),
+            {"task_id": self.task.pk, "status": "in_progress"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        task = await Task.objects.aget(pk=self.task.pk)
+        self.assertEqual(task.status, "in_progress")
+
+    async def test_status_update_rejects_outsiders(self):
+        client = AsyncClient()
+        await client.aforce_login(self.outsider)
+
+        response = await client.post(
+            reverse("tasks:update_status_ajax"),
+            {"task_id": self.task.pk, "status": "in_progress"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    async def test_comment_is_created(self):
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+
+        response = await client.post(
+            reverse("tasks:task_comment_api"),
+            {"task_id": self.task.pk, "comment": "Posted from the async view"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        comment = await TaskComment.objects.aget(pk=response.json()["comment_id"])
+        self.assertEqual(comment.user_id, self.user.pk)
+
+    async def test_user_lists(self):
+        client = AsyncClient()
+        response = await client.get(reverse("tasks:user_list_api"))
+        self.assertEqual(len(response.json()["users"]), 3)
+
+        await client.aforce_login(self.user)
+        response = await client.get(reverse("accounts:user_list_api"))
+        self.assertEqual(response.status_code, 403)
+
+        await client.aforce_login(self.manager)
+        response = await client.get(reverse("accounts:user_list_api"))
+        self.assertEqual(
+            [u["username"] for u in response.json()["users"]],
+            ["async_boss", "async_outsider", "async_worker"],
+        )
+
+    async def test_username_availability(self):
+        client = AsyncClient()
+        url = reverse("accounts:check_username")
+
+        taken = await client.get(url, {"username": "ASYNC_WORKER"})
+        free = await client.get(url, {"username": "someone_new"})
+
+        self.assertFalse(taken.json()["available"])
+        self.assertTrue(free.json()["available"])
@@ -0,0 +1,89 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task, UserTaskCounters
+from apps.tasks.transitions import MAX_BULK_TASKS
+
+
+class BulkStatusUpdateTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.employee = make_user(username="emp", email="emp@example.com")
+        self.url = reverse("tasks:bulk_update_status")
+
+    def _post(self, payload):
+        return self.client.post(
+            self.url, data=json.dumps(payload), content_type="application/json"
+        )
+
+    def test_applies_permitted_rows_and_reports_the_rest(self):
+        working = make_task(assigned_to=self.employee, status="in_progress")
+        also_working = make_task(
+            assigned_to=self.employee, status="in_progress")
+        pending = make_task(assigned_to=self.employee)
+        self.client.login(username="mgr", password="pass12345")
+
+        with self.assertNumQueries(6):
+            r = self._post(
+                {
+                    "task_ids": [working.pk, pending.pk, 999999, also_working.pk],
+                    "status": "completed",
+                }
+            )
+
+        self.assertEqual(r.status_code, 200)
+        body = r.json()
+        self.assertEqual(body["updated"], 2)
+        self.assertFalse(body["success"])
+        results = {row["task_id"]: row for row in body["results"]}
+        self.assertTrue(results[working.pk]["success"])
+        self.assertIn("Cannot change status", results[pending.pk]["error"])
+        self.assertEqual(results[999999]["error"], "Not found")
+
+        working.refresh_from_db()
+        self.assertEqual(working.status, "completed")
+        self.assertIsNotNone(working.completed_at)
+        self.assertEqual(
+            UserTaskCounters.for_user(self.employee).as_counts()["completed"], 2)
+
+    def test_moving_away_from_completed_clears_timestamp(self):
+        task = make_task(assigned_to=self.employee, status="in_progress")
+        task.status = "completed"
+        task.save()
+        Task.objects.filter(pk=task.pk).update(status="in_progress")
+        self.client.login(username="mgr", password="pass12345")
+
+        r = self._post({"task_ids": [task.pk], "status": "cancelled"})
+
+        self.assertTrue(r.json()["success"])
+        task.refresh_from_db()
+        self.assertIsNone(task.completed_at)
+
+    def test_employee_cannot_touch_other_tasks(self):
+        other = make_user(username="other", email="other@example.com")
+        theirs = make_task(assigned_to=other)
+        mine = make_task(assigned_to=self.employee, created_by=self.employee)
+        self.client.login(username="emp", password="pass12345")
+
+        r = self._post(
+            {"task_ids": [theirs.pk, mine.pk], "status": "in_progress"})
+
+        results = {row["task_id"]: row for row in r.json()["results"]}
+        self.assertEqual(results[theirs.pk]["error"], "Forbidden")
+        self.assertTrue(results[mine.pk]["success"])
+        theirs.refresh_from_db()
+        self.assertEqual(theirs.status, "pending")
+
+    def test_rejects_bad_payloads(self):
+        self.client.login(username="mgr", password="pass12345")
+        for payload in (
+            {"status": "completed"},
+            {"task_ids": ["x"], "status": "completed"},
+            {"task_ids": [1], "status": "archived"},
+            {"task_ids": list(range(MAX_BULK_TASKS + 1)), "status": "pending"},
+        ):
+            self.assertEqual(self._post(payload).status_code, 400)
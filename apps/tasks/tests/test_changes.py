@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.changes import changes_cursor
+from apps.tasks.models import Task, TaskComment
+
+
+class TaskChangesTests(TestCase):
+    def setUp(self):
+        self.user = make_user("poller", "poller@example.com")
+        self.task = make_task(assigned_to=self.user)
+        self.client.force_login(self.user)
+        self.detail_url = reverse(
+            "tasks:task_detail", kwargs={"task_id": self.task.pk})
+        self.url = reverse(
+            "tasks:api_task_changes", kwargs={"task_id": self.task.pk})
+
+    def _cursor(self):
+        return self.client.get(self.detail_url).context["changes_cursor"]
+
+    def _comment(self, text="A fresh comment"):
+        return TaskComment.objects.create(
+            task=self.task, user=self.user, comment=text)
+
+    def test_nothing_new_is_a_cheap_204(self):
+        cursor = self._cursor()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"since": cursor})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.content, b"")
+
+    def test_returns_new_comments_then_advances_cursor(self):
+        cursor = self._cursor()
+        first = self._comment("First new comment")
+        second = self._comment("Second new comment")
+
+        payload = self.client.get(self.url, {"since": cursor}).json()
+
+        self.assertEqual([c["id"] for c in payload["comments"]], [first.pk, second.pk])
+        self.assertFalse(payload["task_changed"])
+        self.assertEqual(payload["task"]["comment_count"], 2)
+        response = self.client.get(self.url, {"since": payload["cursor"]})
+        self.assertEqual(response.status_code, 204)
+
+    def test_reports_status_changes(self):
+        cursor = self._cursor()
+        Task.objects.filter(pk=self.task.pk).update(
+            status="in_progress", updated_at=timezone.now() + timedelta(seconds=1))
+
+        payload = self.client.get(self.url, {"since": cursor}).json()
+
+        self.assertTrue(payload["task_changed"])
+        self.assertEqual(payload["task"]["status"], "in_progress")
+        self.assertEqual(payload["task"]["status_display"], "In Progress")
+        self.assertEqual(payload["comments"], [])
+        response = self.client.get(self.url, {"since": payload["cursor"]})
+        self.assertEqual(response.status_code, 204)
+
+    def test_reports_status_changes_from_the_status_endpoint(self):
+        cursor = self._cursor()
+        self.client.post(
+            reverse("tasks:update_status_ajax"),
+            {"task_id": self.task.pk, "status": "in_progress"},
+            content_type="application/json",
+        )
+
+        response = self.client.get(self.url, {"since": cursor})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["task_changed"])
+        self.assertEqual(response.json()["task"]["status"], "in_progress")
+
+    def test_rejects_bad_cursor_and_foreign_tasks(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(
+            self.client.get(self.url, {"since": "not-a-cursor"}).status_code, 400)
+
+        other = make_user("outsider", "outsider@example.com")
+        self.client.force_login(other)
+        response = self.client.get(
+            self.url, {"since": changes_cursor(self.task.updated_at)})
+        self.assertEqual(response.status_code, 403)
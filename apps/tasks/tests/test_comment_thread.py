@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task, TaskComment
+
+
+def _add_comments(task, user, n):
+    base = timezone.now() - timedelta(hours=n)
+    comments = []
+    for i in range(n):
+        comment = TaskComment.objects.create(
+            task=task, user=user, comment=f"Comment number {i}")
+        TaskComment.objects.filter(pk=comment.pk).update(
+            created_at=base + timedelta(minutes=i))
+        comments.append(comment)
+    return comments
+
+
+class CommentCountTests(TestCase):
+    def setUp(self):
+        self.user = make_user("writer", "writer@example.com")
+        self.task = make_task(assigned_to=self.user)
+
+    def _count(self):
+        return Task.objects.values_list("comment_count", flat=True).get(
+            pk=self.task.pk)
+
+    def test_count_follows_creates_and_deletes(self):
+        first, second = _add_comments(self.task, self.user, 2)
+        self.assertEqual(self._count(), 2)
+
+        first.delete()
+        self.assertEqual(self._count(), 1)
+
+    def test_stale_task_save_keeps_the_count(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        _add_comments(self.task, self.user, 3)
+
+        stale.title = "Renamed while comments arrived"
+        stale.save()
+
+        self.assertEqual(self._count(), 3)
+
+    def test_deleting_a_task_skips_per_comment_updates(self):
+        _add_comments(self.task, self.user, 3)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.task.delete()
+
+        self.assertFalse(
+            [q for q in ctx.captured_queries
+             if q["sql"].startswith('UPDATE "tasks_task"')])
+
+        self.assertFalse(TaskComment.objects.exists())
+
+    def test_deleting_the_author_adjusts_other_tasks(self):
+        other = make_user("other", "other@example.com")
+        _add_comments(self.task, other, 2)
+
+        other.delete()
+
+        self.assertEqual(self._count(), 0)
+
+
+@override_settings(TASK_DETAIL_COMMENTS=5)
+class CommentThreadViewTests(TestCase):
+    def setUp(self):
+        self.user = make_user("reader", "reader@example.com")
+        self.task = make_task(assigned_to=self.user)
+        self.comments = _add_comments(self.task, self.user, 12)
+        self.client.force_login(self.user)
+        self.url = reverse("tasks:task_detail", kwargs={"task_id": self.task.pk})
+
+    def test_renders_newest_page_and_total_count(self):
+        response = self.client.get(self.url)
+
+        page = response.context["comments"]
+        self.assertEqual(
+            [c.pk for c in page], [c.pk for c in reversed(self.comments[-5:])])
+        self.assertContains(response, 'id="comment-count">12<')
+        self.assertContains(response, 'id="loadOlderComments"')
+        self.assertContains(response, f'data-cursor="{page.next_cursor}"')
+
+    def test_cursor_endpoint_returns_older_comments(self):
+        page = self.client.get(self.url).context["comments"]
+        api = reverse("tasks:api_task_comments", kwargs={"task_id": self.task.pk})
+
+        payload = self.client.get(
+            api, {"after": page.next_cursor, "page_size": 5}).json()
+
+        self.assertEqual(
+            [c["id"] for c in payload["results"]],
+            [c.pk for c in reversed(self.comments[2:7])],
+        )
+        self.assertIsNotNone(payload["next_cursor"])
+
+    def test_no_load_more_button_when_everything_fits(self):
+        TaskComment.objects.filter(pk__in=[c.pk for c in self.comments[:8]]).delete()
+
+        response = self.client.get(self.url)
+
+        self.assertNotContains(response, 'id="loadOlderComments"')
+        self.assertContains(response, 'id="comment-count">4<')
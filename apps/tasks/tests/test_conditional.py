@@ -0,0 +1,116 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task, TaskComment
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.task = make_task(
+            assigned_to=self.manager, due_date=timezone.now() + timedelta(days=3))
+        self.client.login(username="mgr", password="pass12345")
+        self.list_url = reverse("tasks:task_list")
+        self.detail_url = reverse(
+            "tasks:task_detail", kwargs={"task_id": self.task.pk})
+
+        # The first render mints the CSRF cookie that later ETags include.
+        self.client.get(reverse("core:home"))
+
+    def _revalidate(self, url, first):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    def test_list_returns_304_until_something_changes(self):
+        first = self.client.get(self.list_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+
+        with self.assertNumQueries(2):
+            r = self._revalidate(self.list_url, first)
+        self.assertEqual(r.status_code, 304)
+
+        self.task.status = "in_progress"
+        self.task.save()
+        self.assertEqual(self._revalidate(self.list_url, first).status_code, 200)
+
+        first = self.client.get(self.list_url)
+        make_task(assigned_to=self.manager).delete()
+        self.assertEqual(self._revalidate(self.list_url, first).status_code, 304)
+        Task.objects.filter(pk=self.task.pk).delete()
+        self.assertEqual(self._revalidate(self.list_url, first).status_code, 200)
+
+    def test_list_etag_depends_on_query_and_viewer(self):
+        first = self.client.get(self.list_url)
+        r = self.client.get(
+            self.list_url, {"status": "pending"}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(r.status_code, 200)
+
+        make_user(username="emp", email="emp@example.com")
+        self.client.login(username="emp", password="pass12345")
+        self.assertEqual(self._revalidate(self.list_url, first).status_code, 200)
+
+    def test_detail_tracks_comments(self):
+        first = self.client.get(self.detail_url)
+        self.assertIn("Last-Modified", first)
+        self.assertEqual(self._revalidate(self.detail_url, first).status_code, 304)
+
+        TaskComment.objects.create(
+            task=self.task, user=self.manager, comment="A fresh comment")
+        self.assertEqual(self._revalidate(self.detail_url, first).status_code, 200)
+
+    def test_pending_messages_disable_304(self):
+        first = self.client.get(self.list_url)
+        self.client.post(
+            reverse("tasks:task_update", kwargs={"task_id": self.task.pk}),
+            {
+                "title": self.task.title + " renamed",
+                "description": "Updated description text",
+                "assigned_to": self.manager.pk,
+                "priority": "medium",
+                "status": "pending",
+                "due_date": (timezone.now() + timedelta(days=2)).strftime(
+                    "%Y-%m-%dT%H:%M"),
+            },
+        )
+        Task.objects.filter(pk=self.task.pk).update(
+            updated_at=self.task.updated_at)
+
+        r = self._revalidate(self.list_url, first)
+        self.assertEqual(r.status_code, 200)
+        self.assertNotIn("ETag", r)
+        self.assertContains(r, "Task updated successfully.")
+
+    def test_ajax_status_change_invalidates_list_and_detail(self):
+        list_first = self.client.get(self.list_url)
+        detail_first = self.client.get(self.detail_url)
+
+        self.client.post(
+            reverse("tasks:update_status_ajax"),
+            {"task_id": self.task.pk, "status": "in_progress"},
+            content_type="application/json",
+        )
+
+        r = self._revalidate(self.list_url, list_first)
+        self.assertEqual(r.status_code, 200)
+        r = self._revalidate(self.detail_url, detail_first)
+        self.assertEqual(r.status_code, 200)
+        self.assertContains(r, "In Progress")
+
+    def test_forbidden_detail_carries_no_validators(self):
+        make_user(username="outsider", email="outsider@example.com")
+        self.client.login(username="outsider", password="pass12345")
+
+        r = self.client.get(self.detail_url)
+        self.assertEqual(r.status_code, 403)
+        self.assertNotIn("Last-Modified", r)
+        self.assertNotIn("ETag", r)
+
+        r = self.client.get(
+            self.detail_url,
+            HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+        self.assertEqual(r.status_code, 403)
@@ -0,0 +1,126 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.importer import import_tasks
+from apps.tasks.models import Task, UserTaskCounters
+from apps.tasks.transitions import bulk_transition
+
+
+class UserTaskCountersTests(TestCase):
+    def setUp(self):
+        self.alice = make_user(username="alice", email="alice@example.com")
+        self.bob = make_user(username="bob", email="bob@example.com")
+
+    def _counts(self, user):
+        return UserTaskCounters.for_user(user).as_counts()
+
+    def _expected(self, user):
+        counts = dict.fromkeys(UserTaskCounters.COUNTER_FIELDS, 0)
+        for status in Task.objects.filter(assigned_to=user).values_list(
+            "status", flat=True
+        ):
+            counts["total"] += 1
+            counts[status] += 1
+        return counts
+
+    def _assert_in_sync(self):
+        for user in (self.alice, self.bob):
+            self.assertEqual(self._counts(user), self._expected(user))
+
+    def test_create_status_change_and_reassign(self):
+        task = make_task(assigned_to=self.alice)
+        make_task(assigned_to=self.alice, status="in_progress")
+        self.assertEqual(self._counts(self.alice)["pending"], 1)
+        self._assert_in_sync()
+
+        task.status = "in_progress"
+        task.save(update_fields=["status"])
+        self._assert_in_sync()
+
+        task = Task.objects.get(pk=task.pk)
+        task.assigned_to = self.bob
+        task.status = "completed"
+        task.save()
+        self.assertEqual(self._counts(self.bob)["completed"], 1)
+        self._assert_in_sync()
+
+        task.assigned_to = self.alice
+        task.save(update_fields=["title"])
+        self._assert_in_sync()
+
+    def test_deletes_including_cascades(self):
+        first = make_task(assigned_to=self.alice)
+        make_task(assigned_to=self.alice, status="cancelled")
+        make_task(assigned_to=self.bob, created_by=self.alice)
+
+        first.delete()
+        self._assert_in_sync()
+
+        Task.objects.filter(status="cancelled").delete()
+        self._assert_in_sync()
+
+        self.alice.delete()
+        self.assertEqual(self._counts(self.bob)["total"], 0)
+        self.assertFalse(UserTaskCounters.objects.filter(user_id=self.alice.pk))
+
+    def test_reconcile_repairs_drift(self):
+        make_task(assigned_to=self.alice)
+        make_task(assigned_to=self.bob, status="in_progress")
+        UserTaskCounters.objects.update(total=42, pending=0)
+
+        out = StringIO()
+        call_command("reconcile_task_counters", stdout=out)
+        self.assertIn("2 row(s)", out.getvalue())
+        self._assert_in_sync()
+        self.assertEqual(UserTaskCounters.reconcile(), 0)
+
+    def test_bulk_writes_apply_deltas_without_recounting(self):
+        tasks = [make_task(assigned_to=user) for user in (self.alice, self.bob)]
+        self._assert_in_sync()
+        due = (timezone.now() + timedelta(days=5)).strftime("%Y-%m-%d %H:%M")
+        rows = [
+            (n, {"title": f"Imported task {n}", "description": "Loaded from a file",
+                 "assignee": "alice", "priority": "low", "due_date": due}, None)
+            for n in range(3)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            bulk_transition([task.pk for task in tasks], "in_progress")
+            import_tasks(iter(rows), self.bob)
+
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()])
+        self._assert_in_sync()
+        self.assertEqual(self._counts(self.alice)["pending"], 3)
+
+    def test_status_endpoint_keeps_counters_in_step(self):
+        task = make_task(assigned_to=self.alice)
+        self.client.login(username="alice", password="pass12345")
+
+        r = self.client.post(
+            reverse("tasks:update_task_status", kwargs={"task_id": task.pk}),
+            data=json.dumps({"status": "in_progress"}),
+            content_type="application/json",
+        )
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(self._counts(self.alice)["in_progress"], 1)
+        self._assert_in_sync()
+
+    def test_profile_reads_counters(self):
+        make_task(assigned_to=self.alice, status="completed")
+        make_task(assigned_to=self.alice)
+        UserTaskCounters.for_user(self.alice)
+        self.client.login(username="alice", password="pass12345")
+
+        r = self.client.get(reverse("accounts:profile"))
+        self.assertEqual(r.context["user_stats"]["total_tasks"], 2)
+        self.assertEqual(r.context["user_stats"]["completion_rate"], 50.0)
@@ -0,0 +1,95 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.core.pubsub import get_hub
+from apps.tasks.models import TaskComment
+from apps.tasks.transitions import bulk_transition
+
+
+class TaskEventPublishingTests(TestCase):
+    def setUp(self):
+        self.user = make_user("watcher", "watcher@example.com")
+        self.task = make_task(assigned_to=self.user)
+        patcher = mock.patch("apps.tasks.events.publish")
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _published(self):
+        return [(call.args[0], call.args[1]["type"]) for call in self.publish.call_args_list]
+
+    def test_status_change_is_published_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.status = "in_progress"
+            self.task.save()
+            self.publish.assert_not_called()
+
+        self.assertIn((f"task:{self.task.pk}", "status"), self._published())
+        self.assertIn((f"user:{self.user.pk}", "status"), self._published())
+        self.assertIn(("tasks", "status"), self._published())
+        message = self.publish.call_args.args[1]
+        self.assertEqual(message["old_status"], "pending")
+
+    def test_saves_without_a_status_change_stay_quiet(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = "Only the title changes"
+            self.task.save()
+
+        self.publish.assert_not_called()
+
+    def test_bulk_transitions_and_comments_are_published(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_transition([self.task.pk], "in_progress")
+            TaskComment.objects.create(
+                task=self.task, user=self.user, comment="Wrapped this up")
+
+        self.assertEqual(
+            [kind for channel, kind in self._published() if channel == f"task:{self.task.pk}"],
+            ["status", "comment"],
+        )
+
+
+class TaskEventStreamTests(TestCase):
+    def setUp(self):
+        self.user = make_user("streamer", "streamer@example.com")
+        self.task = make_task(assigned_to=self.user)
+        self.url = reverse("tasks:task_events")
+
+    def test_requires_asgi(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 501)
+
+    @override_settings(EVENTS_HEARTBEAT=1, EVENTS_MAX_DURATION=5)
+    async def test_streams_published_events(self):
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+
+        response = await client.get(self.url, {"task": self.task.pk})
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunks = aiter(response.streaming_content)
+        self.assertTrue((await anext(chunks)).startswith(b"retry:"))
+
+        get_hub().publish(f"task:{self.task.pk}", {"type": "comment", "task_id": self.task.pk})
+        get_hub().publish("task:0", {"type": "comment", "task_id": 0})
+
+        chunk = await asyncio.wait_for(anext(chunks), 2)
+        self.assertTrue(chunk.startswith(b"event: comment\n"))
+        self.assertIn(f'"task_id": {self.task.pk}'.encode(), chunk)
+        self.assertEqual(await asyncio.wait_for(anext(chunks), 2), b": keepalive\n\n")
+        await chunks.aclose()
+
+    async def test_rejects_tasks_the_viewer_cannot_see(self):
+        outsider = await sync_to_async(make_user)("outsider", "outsider@example.com")
+        client = AsyncClient()
+        await client.aforce_login(outsider)
+
+        response = await client.get(self.url, {"task": self.task.pk})
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,100 @@
+import csv
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.exporter import EXPORT_COLUMNS, aiter_export, export_rows
+
+
+class TaskExportTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.alice = make_user(username="alice", email="alice@example.com")
+        self.bob = make_user(username="bob", email="bob@example.com")
+        self.mine = make_task(
+            title="Alice task", assigned_to=self.alice, created_by=self.manager)
+        self.created = make_task(
+            title="Created by Alice", assigned_to=self.bob,
+            created_by=self.alice, status="in_progress")
+        self.hidden = make_task(
+            title="Bob only", assigned_to=self.bob, created_by=self.manager)
+
+    def _body(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_rows_carry_usernames_from_one_query(self):
+        with self.assertNumQueries(1):
+            rows = list(export_rows(type(self.mine).objects.all(), chunk_size=2))
+
+        self.assertEqual([row[0] for row in rows],
+                         [self.mine.pk, self.created.pk, self.hidden.pk])
+        columns = [name for name, _ in EXPORT_COLUMNS]
+        first = dict(zip(columns, rows[0]))
+        self.assertEqual(first["assignee"], "alice")
+        self.assertEqual(first["created_by"], "mgr")
+
+    def test_csv_respects_visibility(self):
+        self.client.login(username="alice", password="pass12345")
+        r = self.client.get(reverse("tasks:task_export"))
+
+        self.assertEqual(r.status_code, 200)
+        self.assertIn("attachment", r["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self._body(r))))
+        self.assertEqual(
+            [row["title"] for row in rows], ["Alice task", "Created by Alice"])
+
+    def test_json_with_filters(self):
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.get(
+            reverse("tasks:task_export"), {"format": "json", "status": "pending"})
+
+        data = json.loads(self._body(r))
+        self.assertEqual(
+            [row["title"] for row in data], ["Alice task", "Bob only"])
+
+        r = self.client.get(
+            reverse("tasks:task_export"), {"format": "json", "status": "completed"})
+        self.assertEqual(json.loads(self._body(r)), [])
+
+        r = self.client.get(reverse("tasks:task_export"), {"format": "xml"})
+        self.assertEqual(r.status_code, 400)
+
+    async def test_asgi_export_streams_asynchronously(self):
+        client = AsyncClient()
+        await client.aforce_login(self.alice)
+
+        r = await client.get(reverse("tasks:task_export"))
+
+        self.assertTrue(r.is_async)
+        body = b"".join([chunk async for chunk in r.streaming_content]).decode()
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual(
+            [row["title"] for row in rows], ["Alice task", "Created by Alice"])
+
+    async def test_async_stream_yields_before_the_source_is_drained(self):
+        pulled = []
+
+        def source():
+            for n in range(5):
+                pulled.append(n)
+                yield f"{n}\n"
+
+        stream = aiter_export(source(), batch_size=2)
+
+        self.assertEqual(await anext(stream), "0\n1\n")
+        self.assertEqual(pulled, [0, 1])
+        self.assertEqual([chunk async for chunk in stream], ["2\n3\n", "4\n"])
+
+    def test_command_writes_csv(self):
+        out = StringIO()
+        call_command("export_tasks", status="in_progress", stdout=out)
+
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["assignee"], "bob")
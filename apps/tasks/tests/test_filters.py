@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import Group
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.filters import filter_tasks, plan_task_filters
+from apps.tasks.models import Task
+
+
+class TaskFilterTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.manager.groups.add(Group.objects.get_or_create(name="Managers")[0])
+        self.employee = make_user(username="emp", email="emp@example.com")
+        self.employee.groups.add(
+            Group.objects.get_or_create(name="Employees")[0])
+
+        self.setup_task = make_task(
+            assigned_to=self.employee,
+            created_by=self.manager,
+            title="Database setup",
+            priority="high",
+            due_date=timezone.now() + timedelta(days=2),
+        )
+        self.overdue_task = make_task(
+            assigned_to=self.employee,
+            created_by=self.manager,
+            title="Fix login page",
+            description="Login page throws an error",
+            priority="low",
+            due_date=timezone.now() - timedelta(days=1),
+        )
+        self.done_task = make_task(
+            assigned_to=self.manager,
+            created_by=self.manager,
+            title="Write release notes",
+            status="completed",
+        )
+
+    def _filter(self, **params):
+        _, qs = filter_tasks(Task.objects.all(), params, user=self.manager)
+        return set(qs.values_list("pk", flat=True))
+
+    def test_no_filters_returns_queryset_untouched(self):
+        qs = Task.objects.all()
+        form, result = filter_tasks(qs, {}, user=self.manager)
+        self.assertFalse(form.is_bound)
+        self.assertIs(result, qs)
+
+    def test_search_matches_title_and_description(self):
+        self.assertEqual(self._filter(search="setup"), {self.setup_task.pk})
+        self.assertEqual(self._filter(search="error"), {self.overdue_task.pk})
+
+    def test_status_and_priority_combine(self):
+        self.assertEqual(
+            self._filter(status="pending", priority="high"),
+            {self.setup_task.pk},
+        )
+        self.assertEqual(self._filter(status="completed", priority="high"), set())
+
+    def test_assignee_and_due_date(self):
+        self.assertEqual(
+            self._filter(assigned_to=self.employee.pk,
+                         due_date=self.setup_task.due_date.date().isoformat()),
+            {self.setup_task.pk},
+        )
+
+    def test_overdue_only_matches_open_tasks(self):
+        make_task(
+            assigned_to=self.employee,
+            created_by=self.manager,
+            title="Dropped migration",
+            status="cancelled",
+            due_date=timezone.now() - timedelta(days=1),
+        )
+        self.assertEqual(self._filter(overdue="on"), {self.overdue_task.pk})
+
+    def test_impossible_combinations_skip_the_database(self):
+        self.assertIsNone(
+            plan_task_filters({"status": "completed", "overdue": True}))
+        self.assertIsNone(
+            plan_task_filters({"status": "cancelled", "overdue": True}))
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        self.assertIsNone(
+            plan_task_filters({"overdue": True, "due_date": tomorrow}))
+
+        _, qs = filter_tasks(
+            Task.objects.all(), {"status": "bogus"}, user=self.manager)
+        with self.assertNumQueries(0):
+            self.assertEqual(list(qs), [])
+
+    def test_task_list_view_applies_filters(self):
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.get(reverse("tasks:task_list"), {"search": "release"})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual([t.pk for t in r.context["tasks"]], [self.done_task.pk])
+        self.assertNotContains(r, "Database setup")
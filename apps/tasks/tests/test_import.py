@@ -0,0 +1,170 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_user
+from apps.tasks.importer import import_tasks, iter_rows
+from apps.tasks.models import Task, UserTaskCounters
+
+
+def _due(days):
+    return (timezone.now() + timedelta(days=days)).strftime("%Y-%m-%d %H:%M")
+
+
+class TaskImportTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.employee = make_user(username="emp", email="emp@example.com")
+
+    def _csv(self, rows):
+        lines = ["title,description,assignee,priority,due_date"]
+        lines += [",".join(row) for row in rows]
+        return "\n".join(lines) + "\n"
+
+    def test_rows_are_validated_with_creation_form_rules(self):
+        data = self._csv(
+            [
+                ("Write the report", "Quarterly numbers for finance", "emp",
+                 "medium", _due(5)),
+                ("Bad", "Too short a title here", "emp", "low", _due(5)),
+                ("Hurry this along", "Urgent but due next week", "emp",
+                 "urgent", _due(7)),
+                ("Assign to nobody", "No such user exists here", "ghost",
+                 "low", _due(5)),
+                ("Already overdue", "Due date in the past", "emp", "low",
+                 _due(-1)),
+            ]
+        )
+        errors = {}
+
+        summary = import_tasks(
+            iter_rows(StringIO(data), "csv"),
+            self.manager,
+            on_error=lambda line, errs: errors.setdefault(line, errs),
+        )
+
+        self.assertEqual(summary, {"created": 1, "failed": 4})
+        self.assertEqual(sorted(errors), [3, 4, 5, 6])
+        self.assertIn("title", errors[3])
+        self.assertIn("__all__", errors[4])
+        self.assertIn("assignee", errors[5])
+        self.assertIn("due_date", errors[6])
+
+        task = Task.objects.get()
+        self.assertEqual(task.assigned_to, self.employee)
+        self.assertEqual(task.created_by, self.manager)
+        self.assertEqual(task.status, "pending")
+        self.assertEqual(
+            UserTaskCounters.for_user(self.employee).as_counts()["pending"], 1)
+
+    def test_queries_scale_with_batches_not_rows(self):
+        rows = [
+            ("Imported task number", "Generated for the test", "emp",
+             "low", _due(5))
+        ] * 30
+        stream = iter_rows(StringIO(self._csv(rows)), "csv")
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = import_tasks(stream, self.manager, batch_size=10)
+
+        self.assertEqual(summary["created"], 30)
+        sql = [q["sql"] for q in ctx.captured_queries]
+        self.assertEqual(
+            sum(s.startswith('INSERT INTO "tasks_task"') for s in sql), 3)
+        self.assertEqual(sum('"auth_user"."username"' in s for s in sql), 1)
+
+    def test_command_reports_line_errors(self):
+        path = self._write_tmp(
+            "tasks.jsonl",
+            "\n".join(
+                [
+                    json.dumps(
+                        {
+                            "title": "Plan the offsite",
+                            "description": "Venue, travel and agenda",
+                            "assignee": "emp",
+                            "due_date": _due(10),
+                        }
+                    ),
+                    "{not json",
+                    "",
+                    json.dumps(["a", "list"]),
+                ]
+            ),
+        )
+        out, err = StringIO(), StringIO()
+
+        call_command(
+            "import_tasks", path, created_by="mgr", stdout=out, stderr=err)
+
+        self.assertIn("Imported 1 task(s), 2 line(s) rejected", out.getvalue())
+        self.assertIn("line 2: __all__: Invalid JSON", err.getvalue())
+        self.assertIn("line 4: __all__: Expected a JSON object.", err.getvalue())
+
+    def test_upload_endpoint(self):
+        upload = SimpleUploadedFile(
+            "tasks.csv",
+            self._csv(
+                [
+                    ("Review the contract", "Check the renewal terms", "emp",
+                     "high", _due(3)),
+                    ("Nope", "Short title row", "emp", "high", _due(3)),
+                ]
+            ).encode(),
+        )
+        url = reverse("tasks:task_import_api")
+
+        self.client.login(username="emp", password="pass12345")
+        self.assertEqual(
+            self.client.post(url, {"file": upload}).status_code, 403)
+
+        upload.seek(0)
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.post(url, {"file": upload})
+
+        self.assertEqual(r.status_code, 200)
+        body = r.json()
+        self.assertEqual((body["created"], body["failed"]), (1, 1))
+        self.assertEqual(body["errors"][0]["line"], 3)
+
+    def test_upload_reports_partial_import_when_decoding_fails(self):
+        rows = [
+            ("Imported task number", "Generated for the test", "emp",
+             "low", _due(5))
+        ] * 600
+        content = self._csv(rows).encode() + b"Broken \xff row,,emp,low,\n"
+        self.client.login(username="mgr", password="pass12345")
+
+        r = self.client.post(
+            reverse("tasks:task_import_api"),
+            {"file": SimpleUploadedFile("tasks.csv", content)},
+        )
+
+        self.assertEqual(r.status_code, 400)
+        body = r.json()
+        self.assertFalse(body["success"])
+        self.assertTrue(body["partial"])
+        self.assertGreaterEqual(body["created"], 500)
+        self.assertEqual(body["created"], Task.objects.count())
+        self.assertGreater(body["stopped_after_line"], body["created"])
+        self.assertIn(f"after line {body['stopped_after_line']}", body["error"])
+
+    def _write_tmp(self, name, content):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, name)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        return path
@@ -0,0 +1,86 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task
+from apps.tasks.pagination import (
+    MAX_PAGE_SIZE,
+    InvalidCursor,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    paginate_queryset,
+)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.tasks = [
+            make_task(
+                assigned_to=self.manager,
+                created_by=self.manager,
+                title=f"Paged task {i}",
+            )
+            for i in range(5)
+        ]
+        self.newest_first = list(
+            Task.objects.order_by("-created_at", "-pk").values_list(
+                "pk", flat=True)
+        )
+
+    def test_cursor_round_trip(self):
+        task = self.tasks[0]
+        token = encode_cursor(task.created_at, task.pk)
+        self.assertEqual(decode_cursor(token), (task.created_at, task.pk))
+
+    def test_malformed_cursor_raises(self):
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("not-a-cursor")
+
+    def test_page_size_is_capped(self):
+        self.assertEqual(clamp_page_size("5000"), MAX_PAGE_SIZE)
+        self.assertEqual(clamp_page_size("0"), 1)
+        self.assertEqual(clamp_page_size("abc", default=7), 7)
+
+    def test_walk_forward_and_back(self):
+        qs = Task.objects.all()
+        first = paginate_queryset(qs, page_size=2)
+        self.assertEqual([t.pk for t in first], self.newest_first[:2])
+        self.assertTrue(first.has_next)
+        self.assertFalse(first.has_previous)
+
+        second = paginate_queryset(qs, after=first.next_cursor, page_size=2)
+        self.assertEqual([t.pk for t in second], self.newest_first[2:4])
+        self.assertTrue(second.has_previous)
+
+        third = paginate_queryset(qs, after=second.next_cursor, page_size=2)
+        self.assertEqual([t.pk for t in third], self.newest_first[4:])
+        self.assertFalse(third.has_next)
+
+        back = paginate_queryset(
+            qs, before=third.previous_cursor, page_size=2)
+        self.assertEqual([t.pk for t in back], self.newest_first[2:4])
+
+        start = paginate_queryset(
+            qs, before=back.previous_cursor, page_size=2)
+        self.assertEqual([t.pk for t in start], self.newest_first[:2])
+        self.assertFalse(start.has_previous)
+
+    def test_deep_page_is_single_query(self):
+        qs = Task.objects.all()
+        cursor = encode_cursor(self.tasks[3].created_at, self.tasks[3].pk)
+        with self.assertNumQueries(1):
+            list(paginate_queryset(qs, after=cursor, page_size=2))
+
+    def test_list_view_paginates_and_ignores_bad_cursor(self):
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.get(reverse("tasks:task_list"), {"page_size": 2})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(r.context["tasks"]), 2)
+        self.assertContains(r, 'rel="next"')
+
+        r = self.client.get(reverse("tasks:task_list"), {"after": "%%%"})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(r.context["tasks"]), 5)
@@ -0,0 +1,69 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task
+
+
+class TaskRowCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.manager = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        self.employee = make_user(username="emp", email="emp@example.com")
+        self.task = make_task(
+            title="Cached row title", assigned_to=self.employee,
+            created_by=self.manager)
+        self.url = reverse("tasks:task_list")
+        self.edit_url = reverse(
+            "tasks:task_update", kwargs={"task_id": self.task.pk})
+
+    def test_rows_are_reused_until_the_task_is_saved(self):
+        self.client.login(username="mgr", password="pass12345")
+        self.assertContains(self.client.get(self.url), "Cached row title")
+
+        # Bypass save(): updated_at stays put, so the cached fragment wins.
+        Task.objects.filter(pk=self.task.pk).update(title="Changed quietly")
+        self.assertContains(self.client.get(self.url), "Cached row title")
+
+        self.task.title = "Saved new title"
+        self.task.save()
+        r = self.client.get(self.url)
+        self.assertContains(r, "Saved new title")
+        self.assertNotContains(r, "Cached row title")
+
+    def test_key_varies_with_viewer(self):
+        other = make_user(username="other", email="other@example.com")
+        self.task.created_by = other
+        self.task.save()
+
+        self.client.login(username="mgr", password="pass12345")
+        self.assertContains(self.client.get(self.url), self.edit_url)
+        self.assertNotContains(self.client.get(self.url), "updateTaskStatus(")
+
+        self.client.login(username="emp", password="pass12345")
+        r = self.client.get(self.url)
+        self.assertContains(r, self.edit_url)
+        self.assertContains(r, f"updateTaskStatus({self.task.pk}, 'completed')")
+
+        self.client.login(username="other", password="pass12345")
+        r = self.client.get(self.url)
+        self.assertContains(r, "Cached row title")
+        self.assertNotContains(r, self.edit_url)
+
+    def test_ajax_status_change_refreshes_the_row(self):
+        self.client.login(username="emp", password="pass12345")
+        r = self.client.get(self.url)
+        self.assertContains(r, "bg-secondary status-badge")
+        self.assertNotContains(r, "bg-primary status-badge")
+
+        self.client.post(
+            reverse("tasks:update_status_ajax"),
+            {"task_id": self.task.pk, "status": "in_progress"},
+            content_type="application/json",
+        )
+
+        r = self.client.get(self.url)
+        self.assertContains(r, "bg-primary status-badge")
+        self.assertNotContains(r, "bg-secondary status-badge")
@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.tasks.models import Task
+from apps.tasks.stats import (
+    aggregate_task_counts,
+    completion_percentage,
+    daily_progress,
+)
+
+
+class AggregateTaskCountsTests(TestCase):
+    def setUp(self):
+        self.user = make_user(
+            username="mgr", email="mgr@example.com", is_manager=True)
+        past = timezone.now() - timedelta(days=2)
+        future = timezone.now() + timedelta(days=2)
+        for status, priority, due in [
+            ("pending", "low", past),
+            ("pending", "high", future),
+            ("in_progress", "high", past),
+            ("completed", "urgent", past),
+            ("cancelled", "medium", future),
+            ("cancelled", "low", past),
+        ]:
+            make_task(
+                assigned_to=self.user,
+                created_by=self.user,
+                status=status,
+                priority=priority,
+                due_date=due,
+            )
+
+    def test_counts_in_a_single_query(self):
+        with self.assertNumQueries(1):
+            counts = aggregate_task_counts(Task.objects.all())
+
+        self.assertEqual(counts["total"], 6)
+        self.assertEqual(counts["pending"], 2)
+        self.assertEqual(counts["in_progress"], 1)
+        self.assertEqual(counts["completed"], 1)
+        self.assertEqual(counts["cancelled"], 2)
+        # Past-due completed and cancelled tasks are not overdue.
+        self.assertEqual(counts["overdue"], 2)
+        self.assertEqual(
+            counts["priority"],
+            {"low": 2, "medium": 1, "high": 2, "urgent": 1},
+        )
+        self.assertEqual(completion_percentage(counts), 16.7)
+
+    def test_empty_queryset(self):
+        counts = aggregate_task_counts(Task.objects.none())
+        self.assertEqual(counts["total"], 0)
+        self.assertEqual(completion_percentage(counts), 0)
+
+    def test_stats_api_uses_aggregate(self):
+        self.client.login(username="mgr", password="pass12345")
+        r = self.client.get(reverse("tasks:task_stats_api"))
+        data = r.json()
+        self.assertEqual(data["total_tasks"], 6)
+        self.assertEqual(data["overdue_tasks"], 2)
+        self.assertEqual(data["status_distribution"]["cancelled"], 2)
+        self.assertEqual(data["priority_distribution"]["high"], 2)
+
+
+class DailyProgressTests(TestCase):
+    def setUp(self):
+        self.user = make_user(username="emp", email="emp@example.com")
+        self.today = timezone.localdate()
+        noon = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        make_task(assigned_to=self.user, due_date=noon, status="completed")
+        make_task(assigned_to=self.user, due_date=noon)
+        make_task(assigned_to=self.user, due_date=noon - timedelta(days=3),
+                  status="completed")
+        make_task(assigned_to=self.user, due_date=noon - timedelta(days=40))
+
+    def test_week_is_zero_filled_in_one_query(self):
+        with self.assertNumQueries(1):
+            week = daily_progress(Task.objects.all(), days=7, end=self.today)
+
+        self.assertEqual(len(week), 7)
+        self.assertEqual(week[0]["date"], self.today - timedelta(days=6))
+        self.assertEqual(
+            (week[-1]["total"], week[-1]["completed"],
+             week[-1]["completion_rate"]),
+            (2, 1, 50),
+        )
+        self.assertEqual(week[-4]["completion_rate"], 100)
+        self.assertEqual(sum(d["total"] for d in week), 3)
+
+    def test_longer_windows(self):
+        quarter = daily_progress(Task.objects.all(), days=90, end=self.today)
+        self.assertEqual(len(quarter), 90)
+        self.assertEqual(sum(d["total"] for d in quarter), 4)
+
+    def test_unsupported_window(self):
+        with self.assertRaises(ValueError):
+            daily_progress(Task.objects.all(), days=14)
@@ -0,0 +1,83 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Task, UserTaskCounters
+from .signals import statuses_changed
+
+VALID_TRANSITIONS = {
+    "pending": {"in_progress", "cancelled"},
+    "in_progress": {"completed", "pending", "cancelled"},
+    "completed": set(),
+    "cancelled": {"pending"},
+}
+
+MAX_BULK_TASKS = 500
+
+
+def can_transition(current_status, new_status):
+    return new_status in VALID_TRANSITIONS.get(current_status, set())
+
+
+def bulk_transition(task_ids, new_status, allowed=None):
+    """
+    Move every task in ``task_ids`` to ``new_status`` where the state
+    machine (and the optional ``allowed(task)`` predicate) permits it.
+
+    Rows are locked, checked one by one and written with a single
+    ``bulk_update``; ``completed_at`` and ``updated_at`` follow the same
+    rules as ``Task.save``. Returns one result dict per requested id, in
+    request order.
+    """
+    now = timezone.now()
+    results = {}
+    changes = []
+
+    with transaction.atomic():
+        tasks = Task.objects.select_for_update().filter(pk__in=task_ids)
+        found = {task.pk: task for task in tasks}
+
+        for task_id in task_ids:
+            task = found.get(task_id)
+            if task is None:
+                results[task_id] = {"success": False, "error": "Not found"}
+                continue
+            if allowed is not None and not allowed(task):
+                results[task_id] = {"success": False, "error": "Forbidden"}
+                continue
+            old_status = task.status
+            if not can_transition(old_status, new_status):
+                results[task_id] = {
+                    "success": False,
+                    "error": f"Cannot change status from {old_status} to {new_status}",
+                }
+                continue
+
+            task.status = new_status
+            if new_status == "completed" and not task.completed_at:
+                task.completed_at = now
+            if new_status != "completed":
+                task.completed_at = None
+            task.updated_at = now
+            changes.append((task, old_status))
+            results[task_id] = {
+                "success": True,
+                "old_status": old_status,
+                "new_status": new_status,
+            }
+
+        if changes:
+            Task.objects.bulk_update(
+                [task for task, _ in changes],
+                ["status", "completed_at", "updated_at"],
+                batch_size=MAX_BULK_TASKS,
+            )
+            deltas = Counter()
+            for task, old_status in changes:
+                deltas[task.assigned_to_id, old_status] -= 1
+                deltas[task.assigned_to_id, new_status] += 1
+            UserTaskCounters.apply_deltas(deltas)
+            statuses_changed.send(sender=Task, changes=changes)
+
+    return [{"task_id": task_id, **results[task_id]} for task_id in task_ids]
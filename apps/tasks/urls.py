@@ -14,7 +14,21 @@ urlpatterns = [
     path("update-status/", views.update_task_status, name="update_status_ajax"),
     path("<int:task_id>/update-status/",
          views.update_task_status, name="update_task_status"),
+    path("bulk-update-status/", views.bulk_update_task_status,
+         name="bulk_update_status"),
+    path("export/", views.task_export_view, name="task_export"),
+    path("api/import/", views.task_import_api, name="task_import_api"),
     path("api/stats/", views.task_stats_api, name="task_stats_api"),
     path("api/users/", views.user_list_api, name="user_list_api"),
     path("api/comments/", views.task_comment_api, name="task_comment_api"),
+
+    # Versioned JSON API
+    path("api/v1/tasks/", views.api_task_list, name="api_task_list"),
+    path("api/v1/tasks/<int:task_id>/",
+         views.api_task_detail, name="api_task_detail"),
+    path("api/v1/tasks/<int:task_id>/comments/",
+         views.api_task_comments, name="api_task_comments"),
+    path("api/v1/tasks/<int:task_id>/changes/",
+         views.api_task_changes, name="api_task_changes"),
+    path("events/", views.task_event_stream, name="task_events"),
 ]
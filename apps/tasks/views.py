@@ -1,83 +1,191 @@
+import io
 import json
+from functools import wraps
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Q
-from django.http import HttpResponseForbidden, JsonResponse
-from django.shortcuts import get_object_or_404, redirect, render
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.http import (
+    HttpResponse,
+    HttpResponseForbidden,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.shortcuts import aget_object_or_404, get_object_or_404, redirect, render
+from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_protect
-from django.views.decorators.http import require_http_methods
-
-from .forms import TaskForm
+from django.views.decorators.http import condition, require_http_methods
+
+from apps.accounts.roles import ais_manager, is_manager
+
+from .api import (
+    COMMENT_FIELDS,
+    TASK_FIELDS,
+    ApiError,
+    parse_fields,
+    select_fields,
+    serialize,
+    task_filters,
+)
+from .changes import changes_cursor, task_changes
+from .conditional import (
+    has_pending_messages,
+    make_etag,
+    task_fingerprint,
+    task_last_modified,
+    task_list_fingerprint,
+)
+from .events import ALL_TASKS_CHANNEL, event_stream
+from .exporter import (
+    CONTENT_TYPES,
+    EXPORT_FORMATS,
+    aiter_export,
+    export_rows,
+    render_export,
+)
+from .filters import filter_tasks
+from .forms import TaskApiForm, TaskCommentForm, TaskForm
+from .importer import (
+    IMPORT_FORMATS,
+    ImportFormatError,
+    detect_format,
+    import_tasks,
+    iter_rows,
+)
 from .models import Task, TaskComment
+from .pagination import InvalidCursor, paginate_queryset
+from .stats import cached_task_counts
+from .transitions import MAX_BULK_TASKS, bulk_transition, can_transition
+
+MAX_REPORTED_IMPORT_ERRORS = 100
 
 
 def _is_manager(user):
-    if not user.is_authenticated:
-        return False
-    if user.is_superuser or user.is_staff:
-        return True
+    return is_manager(user)
 
-    userprofile = getattr(user, "userprofile", None)
-    if userprofile and getattr(userprofile, "role", None) == "manager":
-        return True
 
-    return user.groups.filter(name__in=["Manager", "Managers"]).exists()
+def _can_create_task(user):
+    return is_manager(user)
 
 
-def _can_create_task(user):
+def _can_access_task(user, task: Task):
     if not user.is_authenticated:
         return False
-    if user.is_staff or user.is_superuser:
-        return True
-
-    userprofile = getattr(user, "userprofile", None)
-    if userprofile and getattr(userprofile, "role", None) == "manager":
+    if _is_manager(user):
         return True
-
-    return user.groups.filter(name__in=["Manager", "Managers"]).exists()
+    return task.assigned_to_id == user.id or task.created_by_id == user.id
 
 
-def _can_access_task(user, task: Task):
+async def _acan_access_task(user, task: Task):
     if not user.is_authenticated:
         return False
-    if _is_manager(user):
+    if await ais_manager(user):
         return True
     return task.assigned_to_id == user.id or task.created_by_id == user.id
 
 
+def _visible_tasks(user, queryset=None):
+    """Queryset form of ``_can_access_task``."""
+    qs = Task.objects.all() if queryset is None else queryset
+    if _is_manager(user):
+        return qs
+    return qs.filter(Q(assigned_to=user) | Q(created_by=user))
+
+
+def _task_list_etag(request):
+    if has_pending_messages(request):
+        return None
+    counts = task_list_fingerprint(request, _visible_tasks(request.user))
+    return make_etag(
+        request,
+        counts["latest"],
+        counts["total"],
+        counts["overdue"],
+        *(counts[status] for status, _ in Task.STATUS_CHOICES),
+    )
+
+
+def _task_detail_etag(request, task_id):
+    if has_pending_messages(request):
+        return None
+    # Tasks the viewer cannot see get no validators, so a conditional
+    # request cannot turn their 403 into a 304.
+    fingerprint = task_fingerprint(request, _visible_tasks(request.user), task_id)
+    if fingerprint is None:
+        return None
+    return make_etag(
+        request,
+        fingerprint["updated_at"],
+        fingerprint["last_comment"],
+        fingerprint["comment_count"],
+        fingerprint["due_date"] < timezone.now(),
+        timezone.localdate(),
+    )
+
+
+def _task_detail_last_modified(request, task_id):
+    if has_pending_messages(request):
+        return None
+    return task_last_modified(
+        task_fingerprint(request, _visible_tasks(request.user), task_id))
+
+
 @login_required
+@condition(etag_func=_task_list_etag)
 def task_list_view(request):
-    qs = Task.objects.select_related("assigned_to", "created_by")
+    qs = _visible_tasks(
+        request.user, Task.objects.select_related("assigned_to", "created_by")
+    )
 
-    if not _is_manager(request.user):
-        qs = qs.filter(Q(assigned_to=request.user)
-                       | Q(created_by=request.user))
+    counts = task_list_fingerprint(request, qs)
 
-    now = timezone.now()
-    pending_count = qs.filter(status="pending").count()
-    in_progress_count = qs.filter(status="in_progress").count()
-    completed_count = qs.filter(status="completed").count()
-    overdue_count = qs.exclude(status="completed").filter(
-        due_date__lt=now).count()
+    filter_form, filtered = filter_tasks(qs, request.GET, user=request.user)
+    # Part of the row fragment cache key in task_list.html.
+    filtered = filtered.annotate(
+        viewer_is_assignee=ExpressionWrapper(
+            Q(assigned_to=request.user), output_field=BooleanField()
+        )
+    )
+
+    try:
+        page = paginate_queryset(
+            filtered,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            page_size=request.GET.get("page_size"),
+        )
+    except InvalidCursor:
+        page = paginate_queryset(
+            filtered, page_size=request.GET.get("page_size"))
 
     return render(
         request,
         "tasks/task_list.html",
         {
-            "tasks": qs,
-            "pending_count": pending_count,
-            "in_progress_count": in_progress_count,
-            "completed_count": completed_count,
-            "overdue_count": overdue_count,
+            "tasks": page.object_list,
+            "page": page,
+            "filter_form": filter_form,
+            "pending_count": counts["pending"],
+            "in_progress_count": counts["in_progress"],
+            "completed_count": counts["completed"],
+            "overdue_count": counts["overdue"],
             "is_manager": _is_manager(request.user),
+            "row_cache_timeout": settings.TASK_ROW_CACHE_TIMEOUT,
         },
     )
 
 
 @login_required
+@condition(
+    etag_func=_task_detail_etag,
+    last_modified_func=_task_detail_last_modified,
+)
 def task_detail_view(request, task_id):
     task = get_object_or_404(
         Task.objects.select_related("assigned_to", "created_by"), id=task_id
@@ -85,8 +193,28 @@ def task_detail_view(request, task_id):
     if not _can_access_task(request.user, task):
         return HttpResponseForbidden()
 
-    comments = task.comments.select_related("user")
-    return render(request, "tasks/task_detail.html", {"task": task, "comments": comments})
+    # Newest comments only; the template pages back through older ones
+    # with the v1 comments endpoint and the page's next_cursor.
+    comments = paginate_queryset(
+        task.comments.select_related("user"),
+        page_size=settings.TASK_DETAIL_COMMENTS,
+    )
+    return render(
+        request,
+        "tasks/task_detail.html",
+        {
+            "task": task,
+            "comments": comments,
+            "changes_cursor": changes_cursor(
+                task.updated_at, comments.object_list[0] if comments else None),
+            "poll_interval": settings.TASK_POLL_INTERVAL,
+            "events_url": (
+                f"{reverse('tasks:task_events')}?task={task.pk}"
+                if settings.EVENTS_STREAM
+                else None
+            ),
+        },
+    )
 
 
 @login_required
@@ -143,10 +271,40 @@ def task_delete_view(request, task_id):
     return render(request, "tasks/task_confirm_delete.html", {"task": task})
 
 
+@transaction.atomic
+def _apply_status_change(user, task_id, new_status):
+    """
+    Locked half of ``update_task_status``; returns ``(payload, status)``.
+
+    There is no async ``transaction.atomic``, so the row lock, the
+    transition check and the write run together on one worker thread.
+    """
+    # Lock the row so the transition check, the status write and the
+    # assignee's counter update commit together.
+    task = get_object_or_404(Task.objects.select_for_update(), id=task_id)
+    if not _can_access_task(user, task):
+        return {"success": False, "error": "Forbidden"}, 403
+
+    valid_statuses = {k for k, _ in Task.STATUS_CHOICES}
+    if new_status not in valid_statuses:
+        return {"success": False, "error": "Invalid status"}, 400
+
+    current_status = task.status
+    if not can_transition(current_status, new_status):
+        return {
+            "success": False,
+            "error": f"Cannot change status from {current_status} to {new_status}",
+        }, 400
+
+    task.status = new_status
+    task.save(update_fields=["status"])
+    return {"success": True, "task_id": task.id, "new_status": task.status}, 200
+
+
 @csrf_protect
 @require_http_methods(["POST"])
 @login_required
-def update_task_status(request, task_id=None):
+async def update_task_status(request, task_id=None):
     content_type = (request.content_type or "").split(";")[0].strip().lower()
 
     if content_type == "application/json":
@@ -165,73 +323,156 @@ def update_task_status(request, task_id=None):
     if not new_status:
         return JsonResponse({"success": False, "error": "Missing status"}, status=400)
 
-    task = get_object_or_404(Task, id=incoming_task_id)
-    if not _can_access_task(request.user, task):
-        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+    user = await request.auser()
+    body, status = await sync_to_async(_apply_status_change)(
+        user, incoming_task_id, new_status)
+    return JsonResponse(body, status=status)
 
-    valid_statuses = {k for k, _ in Task.STATUS_CHOICES}
-    if new_status not in valid_statuses:
-        return JsonResponse({"success": False, "error": "Invalid status"}, status=400)
 
-    current_status = task.status
-    valid_transitions = {
-        "pending": {"in_progress", "cancelled"},
-        "in_progress": {"completed", "pending", "cancelled"},
-        "completed": set(),
-        "cancelled": {"pending"},
-    }
-    if new_status not in valid_transitions.get(current_status, set()):
+@csrf_protect
+@require_http_methods(["POST"])
+@login_required
+def bulk_update_task_status(request):
+    content_type = (request.content_type or "").split(";")[0].strip().lower()
+
+    if content_type == "application/json":
+        try:
+            payload = json.loads((request.body or b"{}").decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
+        raw_ids = payload.get("task_ids")
+        new_status = payload.get("status")
+    else:
+        raw_ids = request.POST.getlist("task_ids")
+        new_status = request.POST.get("status")
+
+    if not isinstance(raw_ids, list) or not raw_ids:
+        return JsonResponse({"success": False, "error": "Missing task_ids"}, status=400)
+    try:
+        task_ids = list(dict.fromkeys(int(pk) for pk in raw_ids))
+    except (TypeError, ValueError):
+        return JsonResponse({"success": False, "error": "Invalid task_ids"}, status=400)
+    if len(task_ids) > MAX_BULK_TASKS:
         return JsonResponse(
             {
                 "success": False,
-                "error": f"Cannot change status from {current_status} to {new_status}",
+                "error": f"At most {MAX_BULK_TASKS} tasks per request",
             },
             status=400,
         )
 
-    task.status = new_status
-    task.save(update_fields=["status"])
+    valid_statuses = {k for k, _ in Task.STATUS_CHOICES}
+    if new_status not in valid_statuses:
+        return JsonResponse({"success": False, "error": "Invalid status"}, status=400)
+
+    results = bulk_transition(
+        task_ids,
+        new_status,
+        allowed=lambda task: _can_access_task(request.user, task),
+    )
+    updated = sum(1 for result in results if result["success"])
 
     return JsonResponse(
-        {"success": True, "task_id": task.id, "new_status": task.status}, status=200
+        {
+            "success": updated == len(results),
+            "updated": updated,
+            "results": results,
+        },
+        status=200,
     )
 
 
+@csrf_protect
+@require_http_methods(["POST"])
+@login_required
+def task_import_api(request):
+    if not _can_create_task(request.user):
+        return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
+
+    upload = request.FILES.get("file")
+    if upload is None:
+        return JsonResponse({"success": False, "error": "Missing file"}, status=400)
+    try:
+        fmt = detect_format(upload.name, default=request.POST.get("format"))
+        if fmt not in IMPORT_FORMATS:
+            raise ImportFormatError(f"Unsupported format '{fmt}'.")
+    except ImportFormatError as exc:
+        return JsonResponse({"success": False, "error": str(exc)}, status=400)
+
+    errors = []
+
+    def collect(line_number, line_errors):
+        if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+            errors.append({"line": line_number, "errors": line_errors})
+
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        summary = import_tasks(
+            iter_rows(stream, fmt), request.user, on_error=collect)
+    finally:
+        stream.detach()
+
+    body = {
+        "success": summary["failed"] == 0,
+        "created": summary["created"],
+        "failed": summary["failed"],
+        "errors": errors,
+    }
+    if "read_error" not in summary:
+        return JsonResponse(body, status=200)
+
+    # Earlier batches are already committed; say exactly how far it got.
+    body.update(
+        success=False,
+        partial=summary["created"] > 0,
+        stopped_after_line=summary["stopped_after_line"],
+        error=(
+            f"Could not read file after line {summary['stopped_after_line']}: "
+            f"{summary['read_error']}. {summary['created']} task(s) before "
+            "that point were imported."
+        ),
+    )
+    return JsonResponse(body, status=400)
+
+
 @require_http_methods(["GET"])
 @login_required
-def task_stats_api(request):
-    qs = Task.objects.all()
-    if not _is_manager(request.user):
-        qs = qs.filter(Q(assigned_to=request.user)
-                       | Q(created_by=request.user))
+def task_export_view(request):
+    fmt = request.GET.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return JsonResponse({"success": False, "error": "Invalid format"}, status=400)
+
+    _, qs = filter_tasks(
+        _visible_tasks(request.user), request.GET, user=request.user)
 
-    now = timezone.now()
+    content = render_export(export_rows(qs), fmt)
+    if isinstance(request, ASGIRequest):
+        content = aiter_export(content)
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+    filename = f"tasks-{timezone.localdate():%Y%m%d}.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-    total_tasks = qs.count()
-    pending_tasks = qs.filter(status="pending").count()
-    in_progress_tasks = qs.filter(status="in_progress").count()
-    completed_tasks = qs.filter(status="completed").count()
-    overdue_tasks = qs.exclude(status="completed").filter(
-        due_date__lt=now).count()
 
-    priority_distribution = {k: 0 for k, _ in Task.PRIORITY_CHOICES}
-    for row in qs.values("priority").annotate(count=Count("id")):
-        if row["priority"] in priority_distribution:
-            priority_distribution[row["priority"]] = row["count"]
+@require_http_methods(["GET"])
+@login_required
+async def task_stats_api(request):
+    user = await request.auser()
+    # ais_manager memoizes the role, so _visible_tasks stays off the database.
+    scope = "all" if await ais_manager(user) else f"user:{user.pk}"
+    qs = _visible_tasks(user)
 
-    status_distribution = {k: 0 for k, _ in Task.STATUS_CHOICES}
-    for row in qs.values("status").annotate(count=Count("id")):
-        if row["status"] in status_distribution:
-            status_distribution[row["status"]] = row["count"]
+    counts = await sync_to_async(cached_task_counts)(scope, qs)
+    status_distribution = {k: counts[k] for k, _ in Task.STATUS_CHOICES}
 
     return JsonResponse(
         {
-            "total_tasks": total_tasks,
-            "pending_tasks": pending_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "completed_tasks": completed_tasks,
-            "overdue_tasks": overdue_tasks,
-            "priority_distribution": priority_distribution,
+            "total_tasks": counts["total"],
+            "pending_tasks": counts["pending"],
+            "in_progress_tasks": counts["in_progress"],
+            "completed_tasks": counts["completed"],
+            "overdue_tasks": counts["overdue"],
+            "priority_distribution": counts["priority"],
             "status_distribution": status_distribution,
         },
         status=200,
@@ -239,16 +480,16 @@ def task_stats_api(request):
 
 
 @require_http_methods(["GET"])
-def user_list_api(request):
+async def user_list_api(request):
     User = get_user_model()
-    users = list(User.objects.order_by("id").values("id", "username"))
+    users = [u async for u in User.objects.order_by("id").values("id", "username")]
     return JsonResponse({"users": users}, status=200)
 
 
 @csrf_protect
 @require_http_methods(["POST"])
 @login_required
-def task_comment_api(request):
+async def task_comment_api(request):
     content_type = (request.content_type or "").split(";")[0].strip().lower()
     if content_type == "application/json":
         try:
@@ -266,8 +507,9 @@ def task_comment_api(request):
     if not comment_text:
         return JsonResponse({"success": False, "error": "Missing comment"}, status=400)
 
-    task = get_object_or_404(Task, id=task_id)
-    if not _can_access_task(request.user, task):
+    user = await request.auser()
+    task = await aget_object_or_404(Task, id=task_id)
+    if not await _acan_access_task(user, task):
         return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
 
     model_field_names = {f.name for f in TaskComment._meta.fields}
@@ -282,9 +524,208 @@ def task_comment_api(request):
         )
 
     create_kwargs = {"task": task,
-                     "user": request.user, text_field: comment_text}
-    created = TaskComment.objects.create(**create_kwargs)
+                     "user": user, text_field: comment_text}
+    created = await TaskComment.objects.acreate(**create_kwargs)
 
     return JsonResponse(
         {"success": True, "comment_id": created.id, "task_id": task.id}, status=200
     )
+
+
+def _api_errors(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except ApiError as exc:
+            return JsonResponse(exc.as_dict(), status=exc.status)
+
+    return wrapper
+
+
+def _json_payload(request):
+    try:
+        payload = json.loads((request.body or b"{}").decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise ApiError("Invalid JSON")
+    if not isinstance(payload, dict):
+        raise ApiError("Expected a JSON object")
+    return payload
+
+
+def _form_errors(form):
+    return {field: list(errors) for field, errors in form.errors.items()}
+
+
+def _api_page(request, queryset, spec):
+    names = parse_fields(request.GET.get("fields"), spec)
+    try:
+        page = paginate_queryset(
+            select_fields(queryset, names, spec),
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            page_size=request.GET.get("page_size"),
+        )
+    except InvalidCursor:
+        raise ApiError("Invalid cursor")
+    return JsonResponse(
+        {
+            "results": [serialize(row, names, spec) for row in page],
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+        }
+    )
+
+
+def _api_task(request, queryset, task_id, status=200):
+    names = parse_fields(request.GET.get("fields"), TASK_FIELDS)
+    row = select_fields(queryset.filter(pk=task_id), names, TASK_FIELDS).first()
+    if row is None:
+        if Task.objects.filter(pk=task_id).exists():
+            raise ApiError("Forbidden", status=403)
+        raise ApiError("Not found", status=404)
+    return JsonResponse(serialize(row, names, TASK_FIELDS), status=status)
+
+
+@csrf_protect
+@require_http_methods(["GET", "POST"])
+@login_required
+@_api_errors
+def api_task_list(request):
+    if request.method == "GET":
+        qs = _visible_tasks(request.user).filter(task_filters(request.GET))
+        return _api_page(request, qs, TASK_FIELDS)
+
+    if not _can_create_task(request.user):
+        raise ApiError("Forbidden", status=403)
+
+    form = TaskApiForm(_json_payload(request), user=request.user)
+    if not form.is_valid():
+        raise ApiError("Validation failed", errors=_form_errors(form))
+    task = form.save(commit=False)
+    task.created_by = request.user
+    task.save()
+    return _api_task(request, Task.objects.all(), task.pk, status=201)
+
+
+@csrf_protect
+@require_http_methods(["GET", "PATCH", "DELETE"])
+@login_required
+@_api_errors
+def api_task_detail(request, task_id):
+    if request.method == "GET":
+        return _api_task(request, _visible_tasks(request.user), task_id)
+
+    task = get_object_or_404(Task, id=task_id)
+    if not _can_access_task(request.user, task):
+        raise ApiError("Forbidden", status=403)
+
+    if request.method == "DELETE":
+        if not _is_manager(request.user):
+            raise ApiError("Forbidden", status=403)
+        task.delete()
+        return HttpResponse(status=204)
+
+    payload = _json_payload(request)
+    new_status = payload.get("status", task.status)
+    if new_status != task.status and not can_transition(task.status, new_status):
+        raise ApiError(f"Cannot change status from {task.status} to {new_status}")
+
+    form = TaskApiForm(
+        payload, instance=task, partial=payload.keys(), user=request.user)
+    if not form.is_valid():
+        raise ApiError("Validation failed", errors=_form_errors(form))
+    form.save()
+    return _api_task(request, Task.objects.all(), task.pk)
+
+
+@csrf_protect
+@require_http_methods(["GET", "POST"])
+@login_required
+@_api_errors
+def api_task_comments(request, task_id):
+    task = get_object_or_404(
+        Task.objects.only("assigned_to_id", "created_by_id"), id=task_id)
+    if not _can_access_task(request.user, task):
+        raise ApiError("Forbidden", status=403)
+
+    if request.method == "GET":
+        return _api_page(request, task.comments.all(), COMMENT_FIELDS)
+
+    form = TaskCommentForm(_json_payload(request))
+    if not form.is_valid():
+        raise ApiError("Validation failed", errors=_form_errors(form))
+    comment = form.save(commit=False)
+    comment.task = task
+    comment.user = request.user
+    comment.save()
+
+    row = select_fields(
+        TaskComment.objects.filter(pk=comment.pk),
+        list(COMMENT_FIELDS),
+        COMMENT_FIELDS,
+    ).get()
+    return JsonResponse(
+        serialize(row, list(COMMENT_FIELDS), COMMENT_FIELDS), status=201)
+
+
+@require_http_methods(["GET"])
+@login_required
+@_api_errors
+def api_task_changes(request, task_id):
+    since = request.GET.get("since")
+    if not since:
+        raise ApiError("Missing since cursor")
+    try:
+        changes = task_changes(_visible_tasks(request.user), task_id, since)
+    except InvalidCursor:
+        raise ApiError("Invalid cursor")
+    except Task.DoesNotExist:
+        if Task.objects.filter(pk=task_id).exists():
+            raise ApiError("Forbidden", status=403)
+        raise ApiError("Not found", status=404)
+
+    if changes is None:
+        return HttpResponse(status=204)
+    return JsonResponse(changes)
+
+
+def _event_channels(user, task_id):
+    if task_id is None:
+        return [ALL_TASKS_CHANNEL] if _is_manager(user) else [f"user:{user.pk}"]
+    if not _visible_tasks(user).filter(pk=task_id).exists():
+        if Task.objects.filter(pk=task_id).exists():
+            raise ApiError("Forbidden", status=403)
+        raise ApiError("Not found", status=404)
+    return [f"task:{task_id}"]
+
+
+@require_http_methods(["GET"])
+@login_required
+async def task_event_stream(request):
+    """
+    Server-Sent Events for one task (``?task=<id>``) or, without it, for
+    the viewer's own tasks (every task for managers).
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"success": False, "error": "The event stream needs the ASGI server"},
+            status=501,
+        )
+
+    user = await request.auser()
+    try:
+        task_id = request.GET.get("task")
+        task_id = int(task_id) if task_id else None
+    except ValueError:
+        return JsonResponse({"success": False, "error": "Invalid task id"}, status=400)
+    try:
+        channels = await sync_to_async(_event_channels)(user, task_id)
+    except ApiError as exc:
+        return JsonResponse(exc.as_dict(), status=exc.status)
+
+    response = StreamingHttpResponse(
+        event_stream(channels), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
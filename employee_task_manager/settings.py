@@ -1,6 +1,7 @@
 import os
+import tempfile
 from pathlib import Path
-from decouple import AutoConfig
+from decouple import AutoConfig, Choices
 import dj_database_url
 from django.contrib.messages import constants as messages
 
@@ -64,12 +65,53 @@ TEMPLATES = [
     },
 ]
 
+# Production template mode: compiled templates are kept by the cached loader
+# and wsgi.py parses all of them when a worker boots, so no request pays
+# the parse cost. `manage.py warm_templates --strict` reports templates
+# that fail to compile.
+TEMPLATE_PRECOMPILE = config("TEMPLATE_PRECOMPILE", default=not DEBUG, cast=bool)
+
+if TEMPLATE_PRECOMPILE:
+    TEMPLATES[0]["APP_DIRS"] = False
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        ),
+    ]
+
 WSGI_APPLICATION = "employee_task_manager.wsgi.application"
 
 raw_db_url = config("DATABASE_URL", default="").strip()
 
+# Postgres connection reuse, by DB_POOL_MODE:
+#   persistent  each worker keeps its connection for DB_CONN_MAX_AGE seconds
+#   psycopg     each worker process owns a psycopg_pool pool (Django's
+#               "pool" option, needs psycopg 3); DB_POOL_* size it and
+#               /ops/db-pool/ reports its wait statistics
+#   pgbouncer   DATABASE_URL points at PgBouncer in transaction mode;
+#               connections to the bouncer persist and server-side cursors
+#               are disabled because they cannot span pooled transactions
+DB_POOL_MODE = config(
+    "DB_POOL_MODE",
+    default="persistent",
+    cast=Choices(["persistent", "psycopg", "pgbouncer"]),
+)
+
 if raw_db_url:
-    db = dj_database_url.parse(raw_db_url, conn_max_age=60, ssl_require=True)
+    db = dj_database_url.parse(
+        raw_db_url,
+        # Django's pool replaces persistent connections and rejects both.
+        conn_max_age=(
+            0
+            if DB_POOL_MODE == "psycopg"
+            else config("DB_CONN_MAX_AGE", default=60, cast=int)
+        ),
+        ssl_require=True,
+    )
     db["CONN_HEALTH_CHECKS"] = True
     opts = db.setdefault("OPTIONS", {})
     opts.update(
@@ -82,6 +124,22 @@ if raw_db_url:
             "keepalives_count": 5,
         }
     )
+    if DB_POOL_MODE == "psycopg":
+        pool = {
+            "min_size": config("DB_POOL_MIN_SIZE", default=1, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=4, cast=int),
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+            "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=float),
+            "max_lifetime": config(
+                "DB_POOL_MAX_LIFETIME", default=1800, cast=float),
+        }
+        if config("DB_POOL_CHECK", default=True, cast=bool):
+            from psycopg_pool import ConnectionPool
+
+            pool["check"] = ConnectionPool.check_connection
+        opts["pool"] = pool
+    elif DB_POOL_MODE == "pgbouncer":
+        db["DISABLE_SERVER_SIDE_CURSORS"] = True
     DATABASES = {"default": db}
 else:
     DATABASES = {
@@ -136,6 +194,90 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache backend. CACHE_URL selects it:
+#   redis://host:6379/0 (or rediss://, unix://)  shared Redis, needs redis-py
+#   file:///var/tmp/etm-cache                     per-host file cache
+#   locmem://                                     per-process memory
+# Without CACHE_URL every process gets its own locmem cache. The file cache
+# is opt-in only: it culls by listing its directory on every write, which
+# is too slow for the per-request keys here. CACHE_VERSION
+# orphans every key at once; CACHE_NAMESPACE_VERSIONS does the same for
+# one app's keys (see apps/core/cache.py).
+CACHE_URL = config("CACHE_URL", default="").strip()
+CACHE_VERSION = config("CACHE_VERSION", default=1, cast=int)
+CACHE_MAX_ENTRIES = config("CACHE_MAX_ENTRIES", default=5000, cast=int)
+
+if CACHE_URL.startswith(("redis://", "rediss://", "unix://")):
+    default_cache = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CACHE_URL,
+    }
+elif CACHE_URL.startswith("file://"):
+    default_cache = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": (
+            CACHE_URL.removeprefix("file://")
+            or os.path.join(tempfile.gettempdir(), "employee-task-manager-cache")
+        ),
+        "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+    }
+else:
+    default_cache = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "employee-task-manager",
+        "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+    }
+
+default_cache.update(
+    {
+        "KEY_PREFIX": config("CACHE_KEY_PREFIX", default="etm"),
+        "VERSION": CACHE_VERSION,
+    }
+)
+CACHES = {"default": default_cache}
+
+CACHE_NAMESPACE_VERSIONS = {"tasks": 1, "accounts": 1, "core": 1}
+
+ROLE_CACHE_TIMEOUT = config("ROLE_CACHE_TIMEOUT", default=300, cast=int)
+TASK_ROW_CACHE_TIMEOUT = config("TASK_ROW_CACHE_TIMEOUT", default=600, cast=int)
+HOME_RECENT_TASKS_TTL = config("HOME_RECENT_TASKS_TTL", default=60, cast=int)
+STATS_CACHE_TIMEOUT = config("STATS_CACHE_TIMEOUT", default=30, cast=int)
+PLATFORM_STATS_MAX_AGE = config("PLATFORM_STATS_MAX_AGE", default=60, cast=int)
+TASK_DETAIL_COMMENTS = config("TASK_DETAIL_COMMENTS", default=20, cast=int)
+TASK_POLL_INTERVAL = config("TASK_POLL_INTERVAL", default=15, cast=int)
+
+# Username availability checks on the register form: answers are cached
+# briefly, and each client IP gets a token bucket of USERNAME_CHECK_BURST
+# requests refilled at USERNAME_CHECK_RATE per second.
+# RATELIMIT_TRUSTED_PROXIES is the number of proxies in front of the app;
+# client IPs are read from X-Forwarded-For that many entries from the
+# right. The default of 1 matches the platform router the Procfile runs
+# behind; set it to 0 when serving clients directly.
+USERNAME_CHECK_CACHE_TIMEOUT = config(
+    "USERNAME_CHECK_CACHE_TIMEOUT", default=30, cast=int)
+USERNAME_CHECK_RATE = config("USERNAME_CHECK_RATE", default=1.0, cast=float)
+USERNAME_CHECK_BURST = config("USERNAME_CHECK_BURST", default=20, cast=int)
+RATELIMIT_TRUSTED_PROXIES = config(
+    "RATELIMIT_TRUSTED_PROXIES", default=1, cast=int)
+
+# Live updates over Server-Sent Events. The stream only runs under the ASGI
+# entry point, e.g.
+#   gunicorn employee_task_manager.asgi:application -k uvicorn.workers.UvicornWorker
+# EVENTS_STREAM makes pages connect to it (they poll otherwise). With more
+# than one worker process, EVENTS_BROKER_URL must point at a server that
+# speaks the Redis protocol so events reach streams in every process.
+EVENTS_STREAM = config("EVENTS_STREAM", default=False, cast=bool)
+EVENTS_BROKER_URL = config("EVENTS_BROKER_URL", default="").strip()
+if EVENTS_BROKER_URL:
+    EVENTS_BROKER = {
+        "BACKEND": "apps.core.pubsub.RedisBroker",
+        "URL": EVENTS_BROKER_URL,
+    }
+else:
+    EVENTS_BROKER = {"BACKEND": "apps.core.pubsub.LocalBroker"}
+EVENTS_HEARTBEAT = config("EVENTS_HEARTBEAT", default=20, cast=int)
+EVENTS_MAX_DURATION = config("EVENTS_MAX_DURATION", default=600, cast=int)
+
 LOGIN_URL = "accounts:login"
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
@@ -150,6 +292,24 @@ MESSAGE_TAGS = {
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# Session storage, by SESSION_BACKEND:
+#   cached_db       DB rows read through the cache, so a warm request does
+#                   no session query (default)
+#   cache           cache only; needs a persistent CACHE_URL such as Redis,
+#                   because an evicted entry logs the user out
+#   signed_cookies  no server-side state; the session rides in a signed
+#                   cookie, so keep it small
+#   db              plain DB rows, Django's stock engine
+# Expired DB rows are removed by `manage.py purge_sessions`.
+SESSION_BACKEND = config(
+    "SESSION_BACKEND",
+    default="cached_db",
+    cast=Choices(["db", "cached_db", "cache", "signed_cookies"]),
+)
+SESSION_ENGINE = f"django.contrib.sessions.backends.{SESSION_BACKEND}"
+SESSION_REMEMBER_ME_AGE = config(
+    "SESSION_REMEMBER_ME_AGE", default=60 * 60 * 24 * 30, cast=int)
+
 SESSION_COOKIE_SECURE = not DEBUG
 CSRF_COOKIE_SECURE = not DEBUG
 CSRF_COOKIE_HTTPONLY = False
@@ -6,3 +6,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE',
                       'employee_task_manager.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.TEMPLATE_PRECOMPILE:
+    from apps.core.template_cache import warm_templates  # noqa: E402
+
+    warm_templates()
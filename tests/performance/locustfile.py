@@ -161,7 +161,7 @@ class ManagerUser(HttpUser):
         with self.client.get("/accounts/api/users/", headers=headers, catch_response=True) as response:
             if response.status_code == 200:
                 try:
-                    users = response.json()
+                    users = response.json().get("users")
                     if isinstance(users, list):
                         response.success()
                     else:
@@ -173,6 +173,37 @@ class ManagerUser(HttpUser):
                     f"User list API failed: {response.status_code}")
 
 
+class ApiUser(HttpUser):
+    """
+    JSON endpoints only, for comparing the WSGI and ASGI servers:
+    ``locust -f tests/performance/locustfile.py ApiUser`` against gunicorn,
+    then against uvicorn serving ``employee_task_manager.asgi``.
+    """
+    wait_time = between(0, 0.2)
+
+    def on_start(self):
+        self.client.get("/login/")
+        self.client.post("/login/", {
+            "username": "testmanager",
+            "password": "testpass123",
+        })
+
+    @task(3)
+    def api_task_stats(self):
+        self.client.get("/tasks/api/stats/")
+
+    @task(2)
+    def api_user_list(self):
+        self.client.get("/accounts/api/users/")
+
+    @task(1)
+    def api_check_username(self):
+        username = f"user{random.randint(1, 1000)}"
+        self.client.get("/accounts/api/check-username/",
+                        params={"username": username},
+                        name="/accounts/api/check-username/")
+
+
 class AnonymousUser(HttpUser):
     wait_time = between(3, 8)
     weight = 2
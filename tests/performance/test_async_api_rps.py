@@ -0,0 +1,89 @@
+"""
+Requests-per-second benchmark for the JSON endpoints the locust API
+scenarios hit, through the WSGI handler and through the ASGI handler.
+
+WSGI requests go one at a time, as a sync worker serves them; ASGI
+requests are kept ``CONCURRENCY`` deep on one event loop, as a uvicorn
+worker would see them. Both run in-process against the test database:
+
+    DEBUG=True python -m pytest tests/performance/test_async_api_rps.py -s --no-cov
+
+For numbers from real servers run ``ApiUser`` in tests/performance/locustfile.py
+against ``gunicorn employee_task_manager.wsgi`` and then
+``uvicorn employee_task_manager.asgi:application``.
+"""
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient, Client, TestCase
+from django.urls import reverse
+
+from apps.__testutils__.factories import make_task, make_user
+from apps.accounts.usernames import username_check_bucket
+
+REQUESTS = 200
+CONCURRENCY = 20
+ENDPOINTS = (
+    ("tasks:task_stats_api", {}),
+    ("accounts:user_list_api", {}),
+    ("accounts:check_username", {"username": "bench_nobody"}),
+)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class AsyncApiThroughputBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = make_user(
+            "bench_api_boss", "bench_api_boss@example.com", is_manager=True)
+        for i in range(20):
+            make_task(title=f"Bench task {i}",
+                      assigned_to=cls.manager, created_by=cls.manager)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Every request comes from one address; keep the limiter out of it.
+        patcher = mock.patch.object(username_check_bucket, "burst", 10 * REQUESTS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wsgi_rps(self, url, params):
+        client = Client()
+        client.force_login(self.manager)
+        self.assertEqual(client.get(url, params).status_code, 200)
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            client.get(url, params)
+        return REQUESTS / (time.perf_counter() - started)
+
+    async def _asgi_rps(self, url, params):
+        client = AsyncClient()
+        await client.aforce_login(self.manager)
+        self.assertEqual((await client.get(url, params)).status_code, 200)
+
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def one():
+            async with semaphore:
+                return await client.get(url, params)
+
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(one() for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - started
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        return REQUESTS / elapsed
+
+    def test_requests_per_second(self):
+        print(f"\nrequests/second ({REQUESTS} requests, ASGI concurrency {CONCURRENCY}):")
+        for name, params in ENDPOINTS:
+            url = reverse(name)
+            wsgi = self._wsgi_rps(url, params)
+            asgi = async_to_sync(self._asgi_rps)(url, params)
+            print(f"  {name:<28} wsgi {wsgi:8.1f}   asgi {asgi:8.1f}")
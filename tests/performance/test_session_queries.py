@@ -0,0 +1,65 @@
+"""
+Per-request query benchmark for the session engines.
+
+Logs in once per engine, replays authenticated page views and prints the
+average number of queries per request, split into session-table queries
+and the rest:
+
+    DEBUG=True python -m pytest tests/performance/test_session_queries.py -s --no-cov
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+User = get_user_model()
+
+REQUESTS = 50
+ENGINES = ("db", "cached_db", "cache", "signed_cookies")
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class SessionQueryBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="bench_session", password="pass12345")
+
+    def _measure(self, engine):
+        with override_settings(
+            SESSION_ENGINE=f"django.contrib.sessions.backends.{engine}"
+        ):
+            cache.clear()
+            # SessionMiddleware binds its engine when the handler is built.
+            client = Client()
+            client.force_login(self.user)
+            urls = [
+                reverse("core:employee_dashboard"),
+                reverse("tasks:task_list"),
+            ]
+            response = client.get(urls[0])  # warm caches shared by every engine
+
+            self.assertEqual(response.status_code, 200)
+
+            with CaptureQueriesContext(connection) as ctx:
+                for i in range(REQUESTS):
+                    client.get(urls[i % len(urls)])
+
+        session = sum("django_session" in q["sql"] for q in ctx.captured_queries)
+        return session / REQUESTS, len(ctx.captured_queries) / REQUESTS
+
+    def test_cached_engines_drop_session_queries(self):
+        results = {engine: self._measure(engine) for engine in ENGINES}
+
+        print("\nqueries per authenticated request (session / total):")
+        for engine, (session, total) in results.items():
+            print(f"  {engine:<15} {session:.2f} / {total:.2f}")
+
+        self.assertGreaterEqual(results["db"][0], 1)
+        for engine in ("cached_db", "cache", "signed_cookies"):
+            self.assertEqual(results[engine][0], 0)
+            self.assertLess(results[engine][1], results["db"][1])
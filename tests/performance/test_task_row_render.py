@@ -0,0 +1,93 @@
+"""
+Render-time benchmark for the task list rows.
+
+Renders ``tasks/task_list.html`` for 1,000 tasks with the row fragment
+cache bypassed, cold and warm, and prints milliseconds per 1k rows:
+
+    DEBUG=True python -m pytest tests/performance/test_task_row_render.py -s --no-cov
+"""
+import time
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from apps.tasks.models import Task
+
+User = get_user_model()
+
+ROWS = 1000
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TaskRowRenderBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="bench_mgr", password="pass12345", is_staff=True)
+        employee = User.objects.create_user(
+            username="bench_emp", password="pass12345")
+        now = timezone.now()
+        Task.objects.bulk_create(
+            [
+                Task(
+                    title=f"Benchmark task {i}",
+                    description="Row render benchmark description text",
+                    assigned_to=employee,
+                    created_by=cls.manager,
+                    status=("pending", "in_progress", "completed")[i % 3],
+                    priority=("low", "medium", "high", "urgent")[i % 4],
+                    due_date=now + timedelta(days=(i % 20) - 5),
+                )
+                for i in range(ROWS)
+            ]
+        )
+
+    def _render(self, timeout):
+        request = RequestFactory().get("/tasks/")
+        request.user = self.manager
+        tasks = list(
+            Task.objects.select_related("assigned_to", "created_by").annotate(
+                viewer_is_assignee=ExpressionWrapper(
+                    Q(assigned_to=self.manager), output_field=BooleanField()
+                )
+            )
+        )
+        context = {
+            "tasks": tasks,
+            "is_manager": True,
+            "row_cache_timeout": timeout,
+        }
+        start = time.perf_counter()
+        html = render_to_string("tasks/task_list.html", context, request=request)
+        return (time.perf_counter() - start) * 1000 * 1000 / len(tasks), html
+
+    # LocMemCache culls beyond 300 entries by default, fewer than 1k rows.
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "task-row-benchmark",
+                "OPTIONS": {"MAX_ENTRIES": ROWS * 4},
+            }
+        }
+    )
+    def test_row_cache_speeds_up_rerenders(self):
+        self._render(timeout=0)  # warm the template loader and URL resolver
+        cache.clear()
+        uncached, plain_html = self._render(timeout=0)
+        cold, _ = self._render(timeout=300)
+        warm, cached_html = self._render(timeout=300)
+
+        print(
+            f"\ntask_list.html per 1k rows: no cache {uncached:.1f} ms, "
+            f"cold cache {cold:.1f} ms, warm cache {warm:.1f} ms"
+        )
+        self.assertEqual(plain_html.count("task-card"), cached_html.count("task-card"))
+        self.assertLess(warm, uncached)
@@ -8,6 +8,7 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 
 from apps.accounts.models import UserProfile
+from apps.tasks.filters import filter_tasks
 from apps.tasks.models import Task, TaskComment
 
 
@@ -178,6 +179,45 @@ class DatabasePerformanceTests(TestCase):
             query_time = time.time() - start_time
             self.assertLess(query_time, 0.1)
 
+        now = timezone.now()
+        plans = [
+            (
+                Task.objects.filter(
+                    assigned_to=self.employees[0], status="pending"),
+                ["task_assignee_status_idx"],
+            ),
+            (
+                # The task list's overdue filter, as the view builds it.
+                filter_tasks(
+                    Task.objects.all(), {"overdue": "on"}, user=self.manager)[1],
+                ["task_status_due_idx"],
+            ),
+            (
+                Task.objects.order_by("-created_at", "-id")[:20],
+                ["task_created_idx"],
+            ),
+            (
+                Task.objects.filter(updated_at__gte=now).order_by(),
+                ["task_updated_idx"],
+            ),
+        ]
+        for queryset, index_names in plans:
+            plan = self._query_plan(queryset)
+            self.assertTrue(
+                any(name in plan for name in index_names),
+                f"Expected one of {index_names} in plan:\n{plan}",
+            )
+
+    def _query_plan(self, queryset):
+        if connection.vendor == "postgresql":
+            # Tiny test tables make a sequential scan cheapest; force the
+            # planner to show which index it would pick at production size.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        elif connection.vendor != "sqlite":
+            self.skipTest(f"No plan assertions for {connection.vendor}")
+        return queryset.explain()
+
     def test_large_dataset_performance(self):
         bulk_tasks = []
         for i in range(1000):